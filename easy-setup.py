@@ -6,12 +6,22 @@ Cross-platform Python version
 """
 
 import os
+import re
 import sys
 import subprocess
 import platform
+import shutil
 import getpass
 from pathlib import Path
 
+# Resolve the host platform once; it cannot change during a run
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == 'Windows'
+_IS_MAC = _SYSTEM == 'Darwin'
+
+if _IS_WINDOWS:
+    import ctypes  # Used for the admin check in setup_automation
+
 # Color codes for terminal output
 class Colors:
     RED = '\033[0;31m'
@@ -24,7 +34,7 @@ class Colors:
 
     @staticmethod
     def is_windows():
-        return platform.system() == 'Windows'
+        return _IS_WINDOWS
 
     @staticmethod
     def strip_colors_if_windows():
@@ -57,29 +67,195 @@ SCRIPT_DIR = Path(__file__).parent.resolve()
 CONFIG_DIR = SCRIPT_DIR / '.config'
 CONFIG_FILE = CONFIG_DIR / '.tfs-analyzer-config'
 
-
-def clear_screen():
-    """Clear the terminal screen"""
-    os.system('cls' if platform.system() == 'Windows' else 'clear')
+# 24-hour HH:MM, hour 0-23 (optionally one digit), minute 00-59
+_TIME_RE = re.compile(r'^([01]?\d|2[0-3]):([0-5]\d)$')
+
+
+def render_lines(*lines):
+    """Join lines into one newline-terminated block of terminal text"""
+    return '\n'.join(lines) + '\n'
+
+
+def write_screen(text):
+    """Write pre-rendered terminal text in a single call"""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def write_lines(*lines):
+    """Write a block of lines to the terminal in a single call"""
+    write_screen(render_lines(*lines))
+
+
+# Static screens, rendered once now that Colors is final
+RULE = f"{Colors.CYAN}{'═' * 52}{Colors.NC}"
+
+WELCOME_SCREEN = render_lines(
+    f"{Colors.CYAN}╔════════════════════════════════════════════════════════════╗{Colors.NC}",
+    f"{Colors.CYAN}║   TFS Ticket Analyzer - Easy Setup Wizard                 ║{Colors.NC}",
+    f"{Colors.CYAN}╚════════════════════════════════════════════════════════════╝{Colors.NC}",
+    "",
+    f"{Colors.WHITE}Welcome! This wizard will help you set up your TFS Ticket Analyzer.{Colors.NC}",
+    "",
+    f"{Colors.YELLOW}What this tool does:{Colors.NC}",
+    f"{Colors.GREEN}  ✓ Analyzes your TFS/Azure DevOps tickets{Colors.NC}",
+    f"{Colors.GREEN}  ✓ Shows you what needs attention{Colors.NC}",
+    f"{Colors.GREEN}  ✓ Helps prioritize your work{Colors.NC}",
+    f"{Colors.GREEN}  ✓ Can run automatically every day{Colors.NC}",
+    "",
+    f"{Colors.WHITE}Setup takes about 2-3 minutes.{Colors.NC}",
+    ""
+)
+
+STEP1_SCREEN = render_lines(
+    "",
+    RULE,
+    f"{Colors.CYAN}  Step 1: TFS/Azure DevOps Connection{Colors.NC}",
+    RULE,
+    "",
+    f"{Colors.WHITE}We need to know where your TFS server is located.{Colors.NC}",
+    "",
+    f"{Colors.YELLOW}Common examples:{Colors.NC}",
+    f"{Colors.GRAY}  - https://dev.azure.com/yourcompany{Colors.NC}",
+    f"{Colors.GRAY}  - https://tfs.yourcompany.com/tfs/YourCollection{Colors.NC}",
+    ""
+)
+
+STEP2_SCREEN = render_lines(
+    "",
+    RULE,
+    f"{Colors.CYAN}  Step 2: Authentication Setup{Colors.NC}",
+    RULE,
+    "",
+    f"{Colors.WHITE}How would you like to connect to TFS?{Colors.NC}",
+    "",
+    f"{Colors.GREEN}1. Azure CLI (Recommended - most secure){Colors.NC}",
+    f"{Colors.GRAY}   Uses your Microsoft account to log in{Colors.NC}",
+    "",
+    f"{Colors.YELLOW}2. Personal Access Token{Colors.NC}",
+    f"{Colors.GRAY}   Uses a password-like token you create in TFS{Colors.NC}",
+    ""
+)
+
+PAT_SCREEN = render_lines(
+    "",
+    f"{Colors.CYAN}═══ Setting up Personal Access Token ═══{Colors.NC}",
+    "",
+    f"{Colors.YELLOW}To create a Personal Access Token (PAT):{Colors.NC}",
+    "",
+    f"{Colors.WHITE}1. Open your browser and go to your TFS/Azure DevOps{Colors.NC}",
+    f"{Colors.WHITE}2. Click your profile picture (top right){Colors.NC}",
+    f"{Colors.WHITE}3. Go to: Security > Personal Access Tokens{Colors.NC}",
+    f"{Colors.WHITE}4. Click 'New Token'{Colors.NC}",
+    f"{Colors.WHITE}5. Give it a name like 'TFS Analyzer'{Colors.NC}",
+    f"{Colors.WHITE}6. Check the 'Work Items (Read)' permission{Colors.NC}",
+    f"{Colors.WHITE}7. Click 'Create' and copy the token{Colors.NC}",
+    ""
+)
+
+STEP3_SCREEN = render_lines(
+    "",
+    RULE,
+    f"{Colors.CYAN}  Step 3: Your Display Name{Colors.NC}",
+    RULE,
+    "",
+    f"{Colors.WHITE}What is your display name in TFS/Azure DevOps?{Colors.NC}",
+    f"{Colors.GRAY}This helps find tickets where you're mentioned.{Colors.NC}",
+    "",
+    f"{Colors.YELLOW}Examples: 'John Smith', 'Jane Doe'{Colors.NC}",
+    ""
+)
+
+STEP4_SCREEN = render_lines(
+    "",
+    RULE,
+    f"{Colors.CYAN}  Step 4: How to Show Results{Colors.NC}",
+    RULE,
+    "",
+    f"{Colors.WHITE}How would you like to see your ticket analysis?{Colors.NC}",
+    "",
+    f"{Colors.GREEN}1. Open in Browser (Recommended){Colors.NC}",
+    f"{Colors.GRAY}   Opens a nice HTML report automatically{Colors.NC}",
+    "",
+    f"{Colors.YELLOW}2. Save HTML File{Colors.NC}",
+    f"{Colors.GRAY}   Saves report to your Downloads/Documents folder{Colors.NC}",
+    "",
+    f"{Colors.YELLOW}3. Show in Terminal{Colors.NC}",
+    f"{Colors.GRAY}   Displays results right here{Colors.NC}",
+    ""
+)
+
+STEP5_SCREEN = render_lines(
+    "",
+    RULE,
+    f"{Colors.CYAN}  Step 5: AI Analysis (Optional){Colors.NC}",
+    RULE,
+    "",
+    f"{Colors.WHITE}Enable Claude AI for enhanced ticket analysis?{Colors.NC}",
+    "",
+    f"{Colors.YELLOW}AI features include:{Colors.NC}",
+    f"{Colors.GRAY}  - Intelligent priority assessment{Colors.NC}",
+    f"{Colors.GRAY}  - Smart content summarization{Colors.NC}",
+    f"{Colors.GRAY}  - Action recommendations{Colors.NC}",
+    "",
+    f"{Colors.GRAY}Note: Requires Claude Code CLI (can be set up later){Colors.NC}",
+    ""
+)
+
+STEP6_SCREEN = render_lines(
+    "",
+    RULE,
+    f"{Colors.CYAN}  Step 6: Automatic Daily Analysis (Optional){Colors.NC}",
+    RULE,
+    "",
+    f"{Colors.WHITE}Would you like to run the analysis automatically every day?{Colors.NC}",
+    "",
+    f"{Colors.YELLOW}If yes, it will:{Colors.NC}",
+    f"{Colors.WHITE}  - Run once per day at your chosen time{Colors.NC}",
+    f"{Colors.WHITE}  - Show you your tickets automatically{Colors.NC}",
+    f"{Colors.WHITE}  - Save you time remembering to check{Colors.NC}",
+    ""
+)
+
+COMPLETION_SCREEN = render_lines(
+    "",
+    f"{Colors.GREEN}╔════════════════════════════════════════════════════════════╗{Colors.NC}",
+    f"{Colors.GREEN}║   Setup Complete! ✓                                       ║{Colors.NC}",
+    f"{Colors.GREEN}╚════════════════════════════════════════════════════════════╝{Colors.NC}",
+    "",
+    f"{Colors.WHITE}Your TFS Ticket Analyzer is ready to use!{Colors.NC}",
+    "",
+    f"{Colors.CYAN}═══ Quick Start Commands ═══{Colors.NC}",
+    "",
+    f"{Colors.YELLOW}Analyze today's tickets:{Colors.NC}",
+    f"{Colors.WHITE}  python tfs-analyzer.py 1 --browser{Colors.NC}",
+    "",
+    f"{Colors.YELLOW}Analyze last 7 days:{Colors.NC}",
+    f"{Colors.WHITE}  python tfs-analyzer.py 7 --browser{Colors.NC}",
+    "",
+    f"{Colors.YELLOW}Get help:{Colors.NC}",
+    f"{Colors.WHITE}  python tfs-analyzer.py --help{Colors.NC}",
+    ""
+)
+
+
+if _IS_WINDOWS:
+    def clear_screen():
+        """Clear the terminal screen"""
+        # cmd.exe has no ANSI support by default (see Colors)
+        os.system('cls')
+else:
+    def clear_screen():
+        """Clear the terminal screen"""
+        # Erase display and home the cursor without spawning `clear`
+        sys.stdout.write('\x1b[2J\x1b[H')
+        sys.stdout.flush()
 
 
 def show_welcome():
     """Display welcome screen"""
     clear_screen()
-    print(f"{Colors.CYAN}╔════════════════════════════════════════════════════════════╗{Colors.NC}")
-    print(f"{Colors.CYAN}║   TFS Ticket Analyzer - Easy Setup Wizard                 ║{Colors.NC}")
-    print(f"{Colors.CYAN}╚════════════════════════════════════════════════════════════╝{Colors.NC}")
-    print()
-    print(f"{Colors.WHITE}Welcome! This wizard will help you set up your TFS Ticket Analyzer.{Colors.NC}")
-    print()
-    print(f"{Colors.YELLOW}What this tool does:{Colors.NC}")
-    print(f"{Colors.GREEN}  ✓ Analyzes your TFS/Azure DevOps tickets{Colors.NC}")
-    print(f"{Colors.GREEN}  ✓ Shows you what needs attention{Colors.NC}")
-    print(f"{Colors.GREEN}  ✓ Helps prioritize your work{Colors.NC}")
-    print(f"{Colors.GREEN}  ✓ Can run automatically every day{Colors.NC}")
-    print()
-    print(f"{Colors.WHITE}Setup takes about 2-3 minutes.{Colors.NC}")
-    print()
+    write_screen(WELCOME_SCREEN)
 
     continue_setup = input("Ready to start? (Y/N): ").strip().upper()
     if continue_setup not in ['Y', 'YES']:
@@ -89,17 +265,7 @@ def show_welcome():
 
 def get_tfs_configuration():
     """Get TFS/Azure DevOps connection details"""
-    print()
-    print(f"{Colors.CYAN}════════════════════════════════════════════════════{Colors.NC}")
-    print(f"{Colors.CYAN}  Step 1: TFS/Azure DevOps Connection{Colors.NC}")
-    print(f"{Colors.CYAN}════════════════════════════════════════════════════{Colors.NC}")
-    print()
-    print(f"{Colors.WHITE}We need to know where your TFS server is located.{Colors.NC}")
-    print()
-    print(f"{Colors.YELLOW}Common examples:{Colors.NC}")
-    print(f"{Colors.GRAY}  - https://dev.azure.com/yourcompany{Colors.NC}")
-    print(f"{Colors.GRAY}  - https://tfs.yourcompany.com/tfs/YourCollection{Colors.NC}")
-    print()
+    write_screen(STEP1_SCREEN)
 
     # Get TFS URL
     while True:
@@ -117,10 +283,12 @@ def get_tfs_configuration():
         break
 
     # Get project name
-    print()
-    print(f"{Colors.WHITE}What project do you want to analyze?{Colors.NC}")
-    print(f"{Colors.GRAY}(This is the name of your team project){Colors.NC}")
-    print()
+    write_lines(
+        "",
+        f"{Colors.WHITE}What project do you want to analyze?{Colors.NC}",
+        f"{Colors.GRAY}(This is the name of your team project){Colors.NC}",
+        ""
+    )
 
     while True:
         project_name = input("Enter your project name: ").strip()
@@ -135,31 +303,13 @@ def get_tfs_configuration():
 
 def check_azure_cli():
     """Check if Azure CLI is installed"""
-    try:
-        subprocess.run(['az', '--version'],
-                      stdout=subprocess.DEVNULL,
-                      stderr=subprocess.DEVNULL,
-                      check=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    # A PATH lookup is enough here; `az --version` boots a whole Python interpreter
+    return shutil.which('az') is not None
 
 
 def get_authentication_method():
     """Get authentication method"""
-    print()
-    print(f"{Colors.CYAN}════════════════════════════════════════════════════{Colors.NC}")
-    print(f"{Colors.CYAN}  Step 2: Authentication Setup{Colors.NC}")
-    print(f"{Colors.CYAN}════════════════════════════════════════════════════{Colors.NC}")
-    print()
-    print(f"{Colors.WHITE}How would you like to connect to TFS?{Colors.NC}")
-    print()
-    print(f"{Colors.GREEN}1. Azure CLI (Recommended - most secure){Colors.NC}")
-    print(f"{Colors.GRAY}   Uses your Microsoft account to log in{Colors.NC}")
-    print()
-    print(f"{Colors.YELLOW}2. Personal Access Token{Colors.NC}")
-    print(f"{Colors.GRAY}   Uses a password-like token you create in TFS{Colors.NC}")
-    print()
+    write_screen(STEP2_SCREEN)
 
     choice = input("Choose option (1 or 2): ").strip()
 
@@ -169,35 +319,41 @@ def get_authentication_method():
             print()
             print(f"{Colors.GREEN}✓ Azure CLI is installed{Colors.NC}")
         else:
-            print()
-            print(f"{Colors.RED}Azure CLI is not installed.{Colors.NC}")
-            print()
-            print(f"{Colors.YELLOW}Would you like to:{Colors.NC}")
-            print(f"{Colors.WHITE}  A. Install Azure CLI now{Colors.NC}")
-            print(f"{Colors.WHITE}  B. Use Personal Access Token instead{Colors.NC}")
-            print()
+            write_lines(
+                "",
+                f"{Colors.RED}Azure CLI is not installed.{Colors.NC}",
+                "",
+                f"{Colors.YELLOW}Would you like to:{Colors.NC}",
+                f"{Colors.WHITE}  A. Install Azure CLI now{Colors.NC}",
+                f"{Colors.WHITE}  B. Use Personal Access Token instead{Colors.NC}",
+                ""
+            )
 
             install_choice = input("Choose (A or B): ").strip().upper()
 
             if install_choice == 'A':
-                print()
-                print(f"{Colors.CYAN}To install Azure CLI:{Colors.NC}")
-                print()
+                write_lines(
+                    "",
+                    f"{Colors.CYAN}To install Azure CLI:{Colors.NC}",
+                    ""
+                )
 
-                if platform.system() == 'Windows':
+                if _IS_WINDOWS:
                     print(f"{Colors.WHITE}Download from: https://aka.ms/installazurecliwindows{Colors.NC}")
-                elif platform.system() == 'Darwin':
+                elif _IS_MAC:
                     print(f"{Colors.WHITE}On macOS:{Colors.NC}")
                     print(f"{Colors.GRAY}  brew install azure-cli{Colors.NC}")
                 else:
                     print(f"{Colors.WHITE}On Linux (Ubuntu/Debian):{Colors.NC}")
                     print(f"{Colors.GRAY}  curl -sL https://aka.ms/InstallAzureCLIDeb | sudo bash{Colors.NC}")
 
-                print()
-                print(f"{Colors.YELLOW}After installing:{Colors.NC}")
-                print(f"{Colors.WHITE}  1. Close and reopen your terminal{Colors.NC}")
-                print(f"{Colors.WHITE}  2. Run this setup again{Colors.NC}")
-                print()
+                write_lines(
+                    "",
+                    f"{Colors.YELLOW}After installing:{Colors.NC}",
+                    f"{Colors.WHITE}  1. Close and reopen your terminal{Colors.NC}",
+                    f"{Colors.WHITE}  2. Run this setup again{Colors.NC}",
+                    ""
+                )
                 input("Press Enter to exit")
                 sys.exit(0)
             else:
@@ -205,10 +361,12 @@ def get_authentication_method():
                 return
 
         # Try to authenticate with Azure CLI
-        print()
-        print(f"{Colors.CYAN}Authenticating with Azure CLI...{Colors.NC}")
-        print(f"{Colors.YELLOW}This will open your browser to log in.{Colors.NC}")
-        print()
+        write_lines(
+            "",
+            f"{Colors.CYAN}Authenticating with Azure CLI...{Colors.NC}",
+            f"{Colors.YELLOW}This will open your browser to log in.{Colors.NC}",
+            ""
+        )
 
         try:
             subprocess.run(['az', 'login', '--allow-no-subscriptions'],
@@ -220,9 +378,11 @@ def get_authentication_method():
             config['auth_method'] = 'AzureCLI'
             config['pat'] = ''
         except subprocess.CalledProcessError:
-            print()
-            print(f"{Colors.RED}Azure CLI login failed.{Colors.NC}")
-            print(f"{Colors.YELLOW}Let's try Personal Access Token instead.{Colors.NC}")
+            write_lines(
+                "",
+                f"{Colors.RED}Azure CLI login failed.{Colors.NC}",
+                f"{Colors.YELLOW}Let's try Personal Access Token instead.{Colors.NC}"
+            )
             get_personal_access_token()
     else:
         get_personal_access_token()
@@ -230,26 +390,14 @@ def get_authentication_method():
 
 def get_personal_access_token():
     """Get Personal Access Token from user"""
-    print()
-    print(f"{Colors.CYAN}═══ Setting up Personal Access Token ═══{Colors.NC}")
-    print()
-    print(f"{Colors.YELLOW}To create a Personal Access Token (PAT):{Colors.NC}")
-    print()
-    print(f"{Colors.WHITE}1. Open your browser and go to your TFS/Azure DevOps{Colors.NC}")
-    print(f"{Colors.WHITE}2. Click your profile picture (top right){Colors.NC}")
-    print(f"{Colors.WHITE}3. Go to: Security > Personal Access Tokens{Colors.NC}")
-    print(f"{Colors.WHITE}4. Click 'New Token'{Colors.NC}")
-    print(f"{Colors.WHITE}5. Give it a name like 'TFS Analyzer'{Colors.NC}")
-    print(f"{Colors.WHITE}6. Check the 'Work Items (Read)' permission{Colors.NC}")
-    print(f"{Colors.WHITE}7. Click 'Create' and copy the token{Colors.NC}")
-    print()
+    write_screen(PAT_SCREEN)
 
     open_browser = input("Would you like me to open your TFS page? (Y/N): ").strip().upper()
     if open_browser in ['Y', 'YES'] and config['tfs_url']:
         try:
-            if platform.system() == 'Windows':
+            if _IS_WINDOWS:
                 os.startfile(config['tfs_url'])
-            elif platform.system() == 'Darwin':
+            elif _IS_MAC:
                 subprocess.run(['open', config['tfs_url']])
             else:
                 subprocess.run(['xdg-open', config['tfs_url']])
@@ -265,16 +413,7 @@ def get_personal_access_token():
 
 def get_user_display_name():
     """Get user's display name"""
-    print()
-    print(f"{Colors.CYAN}════════════════════════════════════════════════════{Colors.NC}")
-    print(f"{Colors.CYAN}  Step 3: Your Display Name{Colors.NC}")
-    print(f"{Colors.CYAN}════════════════════════════════════════════════════{Colors.NC}")
-    print()
-    print(f"{Colors.WHITE}What is your display name in TFS/Azure DevOps?{Colors.NC}")
-    print(f"{Colors.GRAY}This helps find tickets where you're mentioned.{Colors.NC}")
-    print()
-    print(f"{Colors.YELLOW}Examples: 'John Smith', 'Jane Doe'{Colors.NC}")
-    print()
+    write_screen(STEP3_SCREEN)
 
     while True:
         display_name = input("Enter your display name: ").strip()
@@ -289,22 +428,7 @@ def get_user_display_name():
 
 def get_output_preference():
     """Get output preference"""
-    print()
-    print(f"{Colors.CYAN}════════════════════════════════════════════════════{Colors.NC}")
-    print(f"{Colors.CYAN}  Step 4: How to Show Results{Colors.NC}")
-    print(f"{Colors.CYAN}════════════════════════════════════════════════════{Colors.NC}")
-    print()
-    print(f"{Colors.WHITE}How would you like to see your ticket analysis?{Colors.NC}")
-    print()
-    print(f"{Colors.GREEN}1. Open in Browser (Recommended){Colors.NC}")
-    print(f"{Colors.GRAY}   Opens a nice HTML report automatically{Colors.NC}")
-    print()
-    print(f"{Colors.YELLOW}2. Save HTML File{Colors.NC}")
-    print(f"{Colors.GRAY}   Saves report to your Downloads/Documents folder{Colors.NC}")
-    print()
-    print(f"{Colors.YELLOW}3. Show in Terminal{Colors.NC}")
-    print(f"{Colors.GRAY}   Displays results right here{Colors.NC}")
-    print()
+    write_screen(STEP4_SCREEN)
 
     choice = input("Choose option (1, 2, or 3): ").strip()
 
@@ -319,20 +443,7 @@ def get_output_preference():
 
 def get_ai_preference():
     """Get AI analysis preference"""
-    print()
-    print(f"{Colors.CYAN}════════════════════════════════════════════════════{Colors.NC}")
-    print(f"{Colors.CYAN}  Step 5: AI Analysis (Optional){Colors.NC}")
-    print(f"{Colors.CYAN}════════════════════════════════════════════════════{Colors.NC}")
-    print()
-    print(f"{Colors.WHITE}Enable Claude AI for enhanced ticket analysis?{Colors.NC}")
-    print()
-    print(f"{Colors.YELLOW}AI features include:{Colors.NC}")
-    print(f"{Colors.GRAY}  - Intelligent priority assessment{Colors.NC}")
-    print(f"{Colors.GRAY}  - Smart content summarization{Colors.NC}")
-    print(f"{Colors.GRAY}  - Action recommendations{Colors.NC}")
-    print()
-    print(f"{Colors.GRAY}Note: Requires Claude Code CLI (can be set up later){Colors.NC}")
-    print()
+    write_screen(STEP5_SCREEN)
 
     use_ai = input("Use AI analysis by default? (Y/N): ").strip().upper()
 
@@ -344,18 +455,7 @@ def get_ai_preference():
 
 def get_automation_preference():
     """Get automation preference"""
-    print()
-    print(f"{Colors.CYAN}════════════════════════════════════════════════════{Colors.NC}")
-    print(f"{Colors.CYAN}  Step 6: Automatic Daily Analysis (Optional){Colors.NC}")
-    print(f"{Colors.CYAN}════════════════════════════════════════════════════{Colors.NC}")
-    print()
-    print(f"{Colors.WHITE}Would you like to run the analysis automatically every day?{Colors.NC}")
-    print()
-    print(f"{Colors.YELLOW}If yes, it will:{Colors.NC}")
-    print(f"{Colors.WHITE}  - Run once per day at your chosen time{Colors.NC}")
-    print(f"{Colors.WHITE}  - Show you your tickets automatically{Colors.NC}")
-    print(f"{Colors.WHITE}  - Save you time remembering to check{Colors.NC}")
-    print()
+    write_screen(STEP6_SCREEN)
 
     automate = input("Set up automatic daily analysis? (Y/N): ").strip().upper()
 
@@ -363,10 +463,12 @@ def get_automation_preference():
         config['automation_time'] = ''
         return
 
-    print()
-    print(f"{Colors.WHITE}What time should it run?{Colors.NC}")
-    print(f"{Colors.GRAY}Enter time in 24-hour format (e.g., 08:00 for 8 AM, 14:30 for 2:30 PM){Colors.NC}")
-    print()
+    write_lines(
+        "",
+        f"{Colors.WHITE}What time should it run?{Colors.NC}",
+        f"{Colors.GRAY}Enter time in 24-hour format (e.g., 08:00 for 8 AM, 14:30 for 2:30 PM){Colors.NC}",
+        ""
+    )
 
     while True:
         time_str = input("Enter time (default: 08:00): ").strip()
@@ -375,26 +477,16 @@ def get_automation_preference():
             time_str = "08:00"
             break
 
-        # Validate time format HH:MM
-        import re
-        if not re.match(r'^\d{1,2}:\d{2}$', time_str):
-            print(f"{Colors.RED}Invalid time format. Please use HH:MM format (e.g., 08:00){Colors.NC}")
+        # Validate time format HH:MM and hour/minute ranges
+        m = _TIME_RE.match(time_str)
+        if not m:
+            print(f"{Colors.RED}Invalid time. Please use HH:MM format with hour 0-23 and minute 0-59 (e.g., 08:00){Colors.NC}")
             continue
 
-        # Validate hour and minute ranges
-        try:
-            hour, minute = map(int, time_str.split(':'))
-
-            if hour < 0 or hour > 23 or minute < 0 or minute > 59:
-                print(f"{Colors.RED}Invalid time. Hour must be 0-23, minute must be 0-59.{Colors.NC}")
-                continue
-
-            # Normalize format to HH:MM
-            time_str = f"{hour:02d}:{minute:02d}"
-            break
-        except ValueError:
-            print(f"{Colors.RED}Invalid time format. Please try again.{Colors.NC}")
-            continue
+        # Normalize format to HH:MM
+        hour, minute = int(m.group(1)), int(m.group(2))
+        time_str = f"{hour:02d}:{minute:02d}"
+        break
 
     config['automation_time'] = time_str
 
@@ -408,23 +500,32 @@ def save_configuration():
     CONFIG_DIR.mkdir(exist_ok=True)
 
     # Set restrictive permissions on Unix-like systems
-    if platform.system() != 'Windows':
+    if not _IS_WINDOWS:
         os.chmod(CONFIG_DIR, 0o700)
 
     # Save configuration file
-    with open(CONFIG_FILE, 'w') as f:
-        f.write(f"TFS_URL={config['tfs_url']}\n")
-        f.write(f"PROJECT_NAME={config['project_name']}\n")
-        f.write(f"USER_DISPLAY_NAME={config['display_name']}\n")
-        f.write(f"DEFAULT_OUTPUT={config['output_method']}\n")
-        f.write("USE_WINDOWS_AUTH=false\n")
-
-        if config['auth_method'] == 'PAT':
-            f.write(f"PAT={config['pat']}\n")
-
-    # Set restrictive permissions on Unix-like systems
-    if platform.system() != 'Windows':
-        os.chmod(CONFIG_FILE, 0o600)
+    content = (
+        f"TFS_URL={config['tfs_url']}\n"
+        f"PROJECT_NAME={config['project_name']}\n"
+        f"USER_DISPLAY_NAME={config['display_name']}\n"
+        f"DEFAULT_OUTPUT={config['output_method']}\n"
+        "USE_WINDOWS_AUTH=false\n"
+    )
+    if config['auth_method'] == 'PAT':
+        content += f"PAT={config['pat']}\n"
+
+    if _IS_WINDOWS:
+        with open(CONFIG_FILE, 'w') as f:
+            f.write(content)
+    else:
+        # Create the file as 0600 so the PAT is never readable by others,
+        # and tighten an existing file before writing to it
+        fd = os.open(CONFIG_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.fchmod(fd, 0o600)
+            os.write(fd, content.encode())
+        finally:
+            os.close(fd)
 
     print(f"{Colors.GREEN}✓ Configuration saved{Colors.NC}")
 
@@ -457,24 +558,25 @@ def setup_automation():
     print()
     print(f"{Colors.CYAN}Setting up automatic daily analysis...{Colors.NC}")
 
-    if platform.system() == 'Windows':
+    if _IS_WINDOWS:
         scheduler_script = SCRIPT_DIR / 'tfs-scheduler-daily.ps1'
 
         if scheduler_script.exists():
             try:
                 # Check if running as admin
-                import ctypes
                 is_admin = ctypes.windll.shell32.IsUserAnAdmin()
 
                 if not is_admin:
-                    print()
-                    print(f"{Colors.YELLOW}⚠ Administrator privileges required for automation setup{Colors.NC}")
-                    print()
-                    print(f"{Colors.WHITE}To set up automation:{Colors.NC}")
-                    print(f"{Colors.GRAY}  1. Right-click PowerShell{Colors.NC}")
-                    print(f"{Colors.GRAY}  2. Select 'Run as Administrator'{Colors.NC}")
-                    print(f"{Colors.GRAY}  3. Run: .\\tfs-scheduler-daily.ps1 -Time '{config['automation_time']}' -OutputMethod '{config['output_method']}'{Colors.NC}")
-                    print()
+                    write_lines(
+                        "",
+                        f"{Colors.YELLOW}⚠ Administrator privileges required for automation setup{Colors.NC}",
+                        "",
+                        f"{Colors.WHITE}To set up automation:{Colors.NC}",
+                        f"{Colors.GRAY}  1. Right-click PowerShell{Colors.NC}",
+                        f"{Colors.GRAY}  2. Select 'Run as Administrator'{Colors.NC}",
+                        f"{Colors.GRAY}  3. Run: .\\tfs-scheduler-daily.ps1 -Time '{config['automation_time']}' -OutputMethod '{config['output_method']}'{Colors.NC}",
+                        ""
+                    )
                     return
 
                 cmd_args = ['powershell', '-ExecutionPolicy', 'Bypass', '-File', str(scheduler_script),
@@ -511,35 +613,22 @@ def setup_automation():
 
 def show_completion_summary():
     """Show completion summary"""
-    print()
-    print(f"{Colors.GREEN}╔════════════════════════════════════════════════════════════╗{Colors.NC}")
-    print(f"{Colors.GREEN}║   Setup Complete! ✓                                       ║{Colors.NC}")
-    print(f"{Colors.GREEN}╚════════════════════════════════════════════════════════════╝{Colors.NC}")
-    print()
-    print(f"{Colors.WHITE}Your TFS Ticket Analyzer is ready to use!{Colors.NC}")
-    print()
-    print(f"{Colors.CYAN}═══ Quick Start Commands ═══{Colors.NC}")
-    print()
-    print(f"{Colors.YELLOW}Analyze today's tickets:{Colors.NC}")
-    print(f"{Colors.WHITE}  python tfs-analyzer.py 1 --browser{Colors.NC}")
-    print()
-    print(f"{Colors.YELLOW}Analyze last 7 days:{Colors.NC}")
-    print(f"{Colors.WHITE}  python tfs-analyzer.py 7 --browser{Colors.NC}")
-    print()
-    print(f"{Colors.YELLOW}Get help:{Colors.NC}")
-    print(f"{Colors.WHITE}  python tfs-analyzer.py --help{Colors.NC}")
-    print()
+    write_screen(COMPLETION_SCREEN)
 
     if config['automation_time']:
-        print(f"{Colors.CYAN}═══ Automation ═══{Colors.NC}")
-        print(f"{Colors.WHITE}Your analyzer will run automatically every day at {config['automation_time']}{Colors.NC}")
-        print()
+        write_lines(
+            f"{Colors.CYAN}═══ Automation ═══{Colors.NC}",
+            f"{Colors.WHITE}Your analyzer will run automatically every day at {config['automation_time']}{Colors.NC}",
+            ""
+        )
 
-    print(f"{Colors.CYAN}═══ Configuration Saved To ═══{Colors.NC}")
-    print(f"{Colors.GRAY}  {CONFIG_DIR}{Colors.NC}")
-    print()
-    print(f"{Colors.YELLOW}Need help? Check the README.md file for more details.{Colors.NC}")
-    print()
+    write_lines(
+        f"{Colors.CYAN}═══ Configuration Saved To ═══{Colors.NC}",
+        f"{Colors.GRAY}  {CONFIG_DIR}{Colors.NC}",
+        "",
+        f"{Colors.YELLOW}Need help? Check the README.md file for more details.{Colors.NC}",
+        ""
+    )
 
 
 def main():
@@ -571,10 +660,12 @@ def main():
 
         # Test configuration
         if not test_configuration():
-            print()
-            print(f"{Colors.YELLOW}Setup completed but connection test failed.{Colors.NC}")
-            print(f"{Colors.YELLOW}Please verify your TFS URL and credentials.{Colors.NC}")
-            print()
+            write_lines(
+                "",
+                f"{Colors.YELLOW}Setup completed but connection test failed.{Colors.NC}",
+                f"{Colors.YELLOW}Please verify your TFS URL and credentials.{Colors.NC}",
+                ""
+            )
             input("Press Enter to exit")
             sys.exit(1)
 
@@ -598,12 +689,14 @@ def main():
         print(f"{Colors.YELLOW}Setup cancelled by user.{Colors.NC}")
         sys.exit(0)
     except Exception as e:
-        print()
-        print(f"{Colors.RED}Setup failed: {e}{Colors.NC}")
-        print()
-        print(f"{Colors.YELLOW}Please try again or use manual setup:{Colors.NC}")
-        print(f"{Colors.WHITE}  python tfs-analyzer.py --setup{Colors.NC}")
-        print()
+        write_lines(
+            "",
+            f"{Colors.RED}Setup failed: {e}{Colors.NC}",
+            "",
+            f"{Colors.YELLOW}Please try again or use manual setup:{Colors.NC}",
+            f"{Colors.WHITE}  python tfs-analyzer.py --setup{Colors.NC}",
+            ""
+        )
         sys.exit(1)
 
 
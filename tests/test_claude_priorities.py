@@ -0,0 +1,93 @@
+"""Tests for reading Claude's per-item priorities out of its response"""
+
+import importlib.util
+import random
+import re
+import unittest
+from pathlib import Path
+
+_SCRIPT = Path(__file__).resolve().parent.parent / 'tfs-analyzer.py'
+_spec = importlib.util.spec_from_file_location('tfs_analyzer', _SCRIPT)
+tfs_analyzer = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(tfs_analyzer)
+
+claude_priorities = tfs_analyzer.TFSAnalyzer._claude_priorities
+
+
+def scan_per_item(claude_response, work_item_id):
+    """The original per-item rule, with IDs matched as whole numbers"""
+    lines = claude_response.split('\n')
+    for i, line in enumerate(lines):
+        # An item without an ID matched every line
+        if work_item_id and work_item_id not in re.findall(r'\d+', line):
+            continue
+        context_section = '\n'.join(lines[max(0, i - 5):min(len(lines), i + 10)])
+        if 'HIGH' in context_section.upper():
+            return 'HIGH'
+        elif 'MEDIUM' in context_section.upper():
+            return 'MEDIUM'
+        elif 'LOW' in context_section.upper():
+            return 'LOW'
+    return None
+
+
+def lines_with(mapping, count=30):
+    """Response of `count` filler lines, with the given line numbers replaced"""
+    return '\n'.join(mapping.get(i, 'filler') for i in range(count))
+
+
+class ClaudePrioritiesTest(unittest.TestCase):
+    
+    def test_empty_response(self):
+        self.assertEqual(claude_priorities(''), {})
+    
+    def test_level_on_mention_line(self):
+        self.assertEqual(claude_priorities('ID: 101 - priority high')['101'], 'HIGH')
+    
+    def test_context_window(self):
+        # 5 lines before the mention to 9 lines after it
+        for offset, expected in ((-5, 'LOW'), (-6, None), (9, 'LOW'), (10, None)):
+            with self.subTest(offset=offset):
+                response = lines_with({15: 'Work item #101', 15 + offset: 'Priority: low'})
+                self.assertEqual(claude_priorities(response).get('101'), expected)
+    
+    def test_high_over_medium_over_low(self):
+        response = lines_with({10: 'low', 11: 'ID 101', 12: 'medium', 13: 'high'})
+        self.assertEqual(claude_priorities(response)['101'], 'HIGH')
+        response = lines_with({10: 'low', 11: 'ID 101', 12: 'medium'})
+        self.assertEqual(claude_priorities(response)['101'], 'MEDIUM')
+    
+    def test_first_mention_with_a_level_wins(self):
+        # No level around the first mention, so the second one decides
+        response = lines_with({0: '#101', 20: '#101 again', 22: 'HIGH', 28: 'LOW'}, count=40)
+        self.assertEqual(claude_priorities(response)['101'], 'HIGH')
+        response = lines_with({0: '#101', 2: 'LOW', 20: '#101 again', 22: 'HIGH'}, count=40)
+        self.assertEqual(claude_priorities(response)['101'], 'LOW')
+    
+    def test_ids_that_are_substrings_of_other_ids(self):
+        response = lines_with({0: 'Item 1234: HIGH', 20: 'Item 12: LOW', 35: 'Item 123 is medium'}, count=50)
+        priorities = claude_priorities(response)
+        self.assertEqual(priorities['1234'], 'HIGH')
+        self.assertEqual(priorities['12'], 'LOW')
+        self.assertEqual(priorities['123'], 'MEDIUM')
+        self.assertNotIn('23', priorities)
+        self.assertNotIn('234', priorities)
+    
+    def test_item_without_id_takes_first_level(self):
+        response = lines_with({12: 'MEDIUM', 20: 'HIGH'})
+        self.assertEqual(claude_priorities(response)[''], 'MEDIUM')
+    
+    def test_matches_per_item_scan(self):
+        words = ['ID', '#12', '123', '1234', '12', 'high', 'Medium', 'LOW', 'risk', 'item 7', '77', '']
+        for seed in range(200):
+            rng = random.Random(seed)
+            response = '\n'.join(' '.join(rng.choice(words) for _ in range(rng.randint(0, 3)))
+                                 for _ in range(rng.randint(0, 40)))
+            priorities = claude_priorities(response)
+            for work_item_id in ('', '7', '12', '77', '123', '1234', '999'):
+                with self.subTest(seed=seed, work_item_id=work_item_id):
+                    self.assertEqual(priorities.get(work_item_id), scan_per_item(response, work_item_id))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+"""Tests for the crontab line printed by --setup-cron"""
+
+import contextlib
+import importlib.util
+import io
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_SCRIPT = Path(__file__).resolve().parent.parent / 'tfs-analyzer.py'
+_spec = importlib.util.spec_from_file_location('tfs_analyzer', _SCRIPT)
+tfs_analyzer = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(tfs_analyzer)
+
+
+def cron_output(time_str):
+    buffer = io.StringIO()
+    with mock.patch.object(tfs_analyzer.sys, 'platform', 'linux'), contextlib.redirect_stdout(buffer):
+        tfs_analyzer.setup_cron_job('html', time_str)
+    return buffer.getvalue()
+
+
+class SetupCronJobTest(unittest.TestCase):
+    
+    def test_schedule_fields(self):
+        for time_str, schedule, label in (('08:00', '0 8 * * *', '08:00'), ('8:05', '5 8 * * *', '08:05'),
+                                          ('23:59', '59 23 * * *', '23:59'), ('00:00', '@daily', '00:00')):
+            with self.subTest(time_str=time_str):
+                output = cron_output(time_str)
+                self.assertIn(f'\n{schedule} /usr/bin/python3 ', output)
+                self.assertIn(f'run daily at {label}', output)
+    
+    def test_malformed_times_are_rejected(self):
+        for time_str in ('-0:30', '+8:00', ' 8: 5', '7:5', '24:00', '12:60', 'ab', '1:2:3', '08:00\n', ''):
+            with self.subTest(time_str=time_str):
+                output = cron_output(time_str)
+                self.assertTrue(output.startswith('[ERROR] Invalid cron time'), output)
+                self.assertNotIn('/usr/bin/python3', output)
+
+
+if __name__ == '__main__':
+    unittest.main()
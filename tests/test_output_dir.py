@@ -0,0 +1,56 @@
+"""Tests for where saved reports are written"""
+
+import contextlib
+import importlib.util
+import io
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_SCRIPT = Path(__file__).resolve().parent.parent / 'tfs-analyzer.py'
+_spec = importlib.util.spec_from_file_location('tfs_analyzer', _SCRIPT)
+tfs_analyzer = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(tfs_analyzer)
+
+WORK_ITEMS = [
+    {'id': 101, 'rev': 1, 'fields': {'System.Title': 'Production crash', 'System.State': 'Active',
+                                     'System.WorkItemType': 'Bug', 'System.Priority': 1}},
+    {'id': 102, 'rev': 1, 'fields': {'System.Title': 'Write docs', 'System.State': 'New',
+                                     'System.WorkItemType': 'Task'}},
+]
+
+
+class OutputDirTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.reports = self.tmp / 'reports'
+        # Built without __init__, which would create the config directory next to the script
+        analyzer = tfs_analyzer.TFSAnalyzer.__new__(tfs_analyzer.TFSAnalyzer)
+        analyzer.config = {'tfs_url': 'https://tfs.example.com/tfs/Collection', 'project_name': 'Project'}
+        analyzer._output_dir = None
+        analyzer.analysis_cache = tfs_analyzer.AnalysisCache(self.tmp / 'analysis-cache.json')
+        self.analyzer = analyzer
+    
+    def run_quietly(self, method, *args):
+        with mock.patch.dict(os.environ, {'TFS_OUTPUT_DIR': str(self.reports)}):
+            with contextlib.redirect_stdout(io.StringIO()):
+                method(*args)
+    
+    def test_traditional_reports_follow_tfs_output_dir(self):
+        for output_type in ('html', 'text'):
+            self.run_quietly(self.analyzer.generate_output, WORK_ITEMS, output_type, 1)
+        self.assertEqual(sorted(path.name for path in self.reports.iterdir()),
+                         ['TFS-Daily-Summary.html', 'TFS-Daily-Summary.txt'])
+    
+    def test_enhanced_reports_follow_tfs_output_dir(self):
+        for output_type in ('html', 'text'):
+            self.run_quietly(self.analyzer._generate_enhanced_output, WORK_ITEMS, 'ID: 101 HIGH', 1, output_type)
+        suffixes = sorted(path.suffix for path in self.reports.glob('tfs_enhanced_analysis_*'))
+        self.assertEqual(suffixes, ['.html', '.txt'])
+
+
+if __name__ == '__main__':
+    unittest.main()
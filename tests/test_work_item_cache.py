@@ -0,0 +1,77 @@
+"""Tests for reusing cached work item details between runs"""
+
+import importlib.util
+import tempfile
+import unittest
+from pathlib import Path
+
+_SCRIPT = Path(__file__).resolve().parent.parent / 'tfs-analyzer.py'
+_spec = importlib.util.spec_from_file_location('tfs_analyzer', _SCRIPT)
+tfs_analyzer = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(tfs_analyzer)
+
+
+class FakeServer:
+    """Answers detail and revision requests for one collection's work items"""
+    
+    def __init__(self, items):
+        self.items = {item['id']: item for item in items}
+        self.requests = []
+    
+    def fetch(self, work_item_ids, fields):
+        # Like _fetch_in_batches, an empty ID list sends no request
+        if not work_item_ids:
+            return []
+        self.requests.append((fields, list(work_item_ids)))
+        return [self.items[work_item_id] for work_item_id in work_item_ids if work_item_id in self.items]
+
+
+class WorkItemCacheTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.cache_file = Path(tempfile.mkdtemp()) / 'items.json'
+    
+    def analyzer_for(self, tfs_url, server):
+        # Built without __init__, which would create the config directory next to the script
+        analyzer = tfs_analyzer.TFSAnalyzer.__new__(tfs_analyzer.TFSAnalyzer)
+        analyzer.config = {'tfs_url': tfs_url, 'project_name': 'Project'}
+        analyzer.work_item_cache = tfs_analyzer.WorkItemCache(self.cache_file)
+        analyzer._fetch_in_batches = server.fetch
+        return analyzer
+    
+    def test_unchanged_item_is_reused(self):
+        server = FakeServer([{'id': 1, 'rev': 1, 'fields': {'System.Title': 'First'}}])
+        analyzer = self.analyzer_for('https://tfs.example.com/tfs/A', server)
+        analyzer._get_current_work_items([1])
+        server.requests.clear()
+        
+        items = analyzer._get_current_work_items([1])
+        self.assertEqual(items[0]['fields']['System.Title'], 'First')
+        self.assertEqual([fields for fields, _ in server.requests], ['System.Rev'])
+    
+    def test_same_id_in_another_collection_is_not_reused(self):
+        server_a = FakeServer([{'id': 1, 'rev': 1, 'fields': {'System.Title': 'From A'}}])
+        analyzer_a = self.analyzer_for('https://tfs.example.com/tfs/A', server_a)
+        analyzer_a._get_current_work_items([1])
+        analyzer_a.work_item_cache.flush()
+        
+        server_b = FakeServer([{'id': 1, 'rev': 1, 'fields': {'System.Title': 'From B'}}])
+        analyzer_b = self.analyzer_for('https://tfs.example.com/tfs/B', server_b)
+        items = analyzer_b._get_current_work_items([1])
+        self.assertEqual(items[0]['fields']['System.Title'], 'From B')
+    
+    def test_stale_item_missing_from_refetch_is_dropped(self):
+        server = FakeServer([{'id': 1, 'rev': 1, 'fields': {'System.Title': 'First'}}])
+        analyzer = self.analyzer_for('https://tfs.example.com/tfs/A', server)
+        analyzer._get_current_work_items([1])
+        
+        # The revision moved, but the item is no longer returned with its details
+        real_fetch = server.fetch
+        server.fetch = lambda ids, fields: ([{'id': 1, 'rev': 2, 'fields': {}}]
+                                            if fields == 'System.Rev' else real_fetch([], fields))
+        analyzer._fetch_in_batches = server.fetch
+        self.assertEqual(analyzer._get_current_work_items([1]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
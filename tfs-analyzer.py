@@ -8,27 +8,79 @@ and provides intelligent priority rankings and action recommendations.
 """
 
 import argparse
+import atexit
+import hashlib
+import heapq
+import html
 import json
 import os
+import re
+import shutil
 import sys
-import subprocess
-import webbrowser
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-import configparser
-import smtplib
-from email.mime.text import MimeText
-from email.mime.multipart import MimeMultipart
-import tempfile
-import shlex
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Any
+from collections import Counter
+from types import MappingProxyType
+from functools import lru_cache
+from itertools import chain, islice
 
+# requests, configparser, smtplib, email, webbrowser, subprocess and concurrent.futures
+# are imported where they are used, so setup, --help and --version start without
+# loading the HTTP, mail and process/thread machinery
+
+def _import_requests():
+    """Import requests on first use, exiting with install instructions if it is missing"""
+    try:
+        import requests
+    except ImportError:
+        print("Error: 'requests' library not found. Install with: pip install requests")
+        sys.exit(1)
+    return requests
+
+# Optional faster JSON handling for large TFS responses and Claude prompts
 try:
-    import requests
-    from requests.auth import HTTPBasicAuth
+    import orjson
+    json_loads = orjson.loads
+    
+    def json_dumps(obj: Any) -> str:
+        """Serialize obj as compact JSON"""
+        return orjson.dumps(obj).decode('utf-8')
 except ImportError:
-    print("Error: 'requests' library not found. Install with: pip install requests")
-    sys.exit(1)
+    json_loads = json.loads
+    
+    def json_dumps(obj: Any) -> str:
+        """Serialize obj as compact JSON"""
+        return json.dumps(obj, separators=(',', ':'))
+
+class OutputRow(NamedTuple):
+    """One analyzed work item, flattened once for the report renderers"""
+    id: Any
+    title: str
+    work_type: str
+    state: str
+    score: int
+    level: str
+    action: str
+    impact: str
+
+class EnhancedRow(NamedTuple):
+    """One work item with Claude's priority assessment merged in, for the enhanced renderers"""
+    id: str
+    title: str
+    work_type: str
+    state: str
+    assigned_to: Any
+    score: int
+    traditional_level: str
+    level: str
+    claude_assessed: bool
+    source: str
+    action: str
+
+# Parsed config files by path, as (st_mtime_ns, values)
+_CONFIG_CACHE: Dict[Path, tuple] = {}
 
 class CrossPlatformConfig:
     """Handle configuration across different platforms"""
@@ -49,9 +101,27 @@ class CrossPlatformConfig:
     
     def load_config(self) -> Dict[str, str]:
         """Load configuration from file"""
-        if not self.config_file.exists():
+        try:
+            mtime_ns = self.config_file.stat().st_mtime_ns
+        except FileNotFoundError:
             return {}
         
+        # Reuse the parsed file until it changes on disk
+        cached = _CONFIG_CACHE.get(self.config_file)
+        if cached is None or cached[0] != mtime_ns:
+            cached = (mtime_ns, self._read_config())
+            _CONFIG_CACHE[self.config_file] = cached
+        
+        return dict(cached[1])
+    
+    def _read_config(self) -> Dict[str, str]:
+        """Parse the configuration file"""
+        # Files written by save_config() are plain "key = value" lines and parse in one pass
+        config_data = self._parse_simple_config(self.config_file.read_text())
+        if config_data is not None:
+            return config_data
+        
+        import configparser
         config = configparser.ConfigParser()
         config.read(self.config_file)
         
@@ -60,26 +130,400 @@ class CrossPlatformConfig:
             
         return dict(config['tfs'])
     
+    @staticmethod
+    def _parse_simple_config(text: str) -> Optional[Dict[str, str]]:
+        """Read the [tfs] section without configparser.
+        
+        Returns None when the file uses anything beyond flat "key = value"
+        lines (continuations, ':' delimiters, interpolation, DEFAULT section),
+        so the caller can fall back to configparser.
+        """
+        section = None
+        config_data = {}
+        found = False
+        for line in text.splitlines():
+            stripped = line.strip()
+            if not stripped or stripped[0] in '#;':
+                continue
+            if line[0].isspace():
+                return None
+            if stripped[0] == '[':
+                if not stripped.endswith(']'):
+                    return None
+                section = stripped[1:-1]
+                if section == 'DEFAULT':
+                    return None
+                found = found or section == 'tfs'
+                continue
+            
+            key, sep, value = line.partition('=')
+            if not sep or ':' in key or '%' in value:
+                return None
+            if section == 'tfs':
+                config_data[key.strip().lower()] = value.strip()
+            elif section is None:
+                return None
+        
+        return config_data if found else {}
+    
     def save_config(self, config_data: Dict[str, str]):
         """Save configuration to file"""
+        import configparser
         config = configparser.ConfigParser()
         config['tfs'] = config_data
         
-        with open(self.config_file, 'w') as f:
-            config.write(f)
-        
-        # Set restrictive permissions on Unix-like systems
-        if sys.platform != 'win32':
-            os.chmod(self.config_file, 0o600)
+        if sys.platform == 'win32':
+            with open(self.config_file, 'w') as f:
+                config.write(f)
+        else:
+            # Create the file as 0600 so the PAT is never readable by others,
+            # and tighten an existing file before writing to it
+            fd = os.open(self.config_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                os.fchmod(fd, 0o600)
+                config.write(f)
+        _CONFIG_CACHE.pop(self.config_file, None)
+
+class JsonCache:
+    """Small JSON-file cache persisted between runs.
+    
+    The file is read on first use and written back once at process exit.
+    Subclasses set VERSION (bump it to drop entries written by older rules)
+    and MAX_ENTRIES.
+    """
+    
+    VERSION = 1
+    MAX_ENTRIES = 5000
+    
+    def __init__(self, cache_file: Path):
+        self.cache_file = cache_file
+        self._entries: Optional[Dict[str, Any]] = None
+        self._dirty = False
+    
+    def _load(self) -> Dict[str, Any]:
+        """Read the cache file on first access"""
+        if self._entries is None:
+            self._entries = {}
+            try:
+                data = json_loads(self.cache_file.read_bytes())
+                if data.get('version') == self.VERSION:
+                    self._entries = data.get('entries', {})
+            except (OSError, ValueError, AttributeError):
+                pass
+            atexit.register(self.flush)
+        return self._entries
+    
+    def get(self, key: str) -> Any:
+        """Stored value for key, if any"""
+        return self._load().get(key)
+    
+    def put(self, key: str, value: Any):
+        """Store a value as the newest entry; it is written out by flush()"""
+        entries = self._load()
+        entries.pop(key, None)
+        entries[key] = value
+        self._dirty = True
+    
+    def flush(self):
+        """Write changed entries back, keeping only the newest MAX_ENTRIES"""
+        if not self._dirty:
+            return
+        entries = self._entries
+        if len(entries) > self.MAX_ENTRIES:
+            entries = dict(list(entries.items())[-self.MAX_ENTRIES:])
+        try:
+            # Serialize in one call (orjson when installed) rather than json.dump's chunked writes
+            content = json_dumps({'version': self.VERSION, 'entries': entries})
+            if sys.platform == 'win32':
+                self.cache_file.write_text(content, encoding='utf-8')
+            else:
+                # Entries hold ticket text and Claude output; keep the file private like the config
+                fd = os.open(self.cache_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    os.fchmod(fd, 0o600)
+                    f.write(content)
+            self._dirty = False
+        except OSError:
+            pass
+
+class AnalysisCache(JsonCache):
+    """Per-work-item [score, level, analysis] results.
+    
+    Entries are keyed on collection URL, work item ID and revision, so an item
+    is only re-scored after it changes in TFS.
+    """
+    
+    # Bump when scoring or analysis rules change so stale results are dropped
+    VERSION = 5
+    
+    @staticmethod
+    def key_for(collection_url: str, work_item: Dict[str, Any]) -> Optional[str]:
+        """Cache key for a work item, or None if it carries no revision"""
+        work_item_id = work_item.get('id')
+        revision = work_item.get('rev') or work_item.get('fields', {}).get('System.ChangedDate')
+        if work_item_id is None or not revision:
+            return None
+        return f"{collection_url}|{work_item_id}:{revision}"
+
+class WorkItemCache(JsonCache):
+    """Work item details as last fetched, keyed on collection URL and work item ID.
+    
+    Each entry is the item as returned by TFS, including its 'rev', so
+    get_work_items() only downloads items whose revision has moved.
+    """
+    
+    # Bump when DETAILS_FIELDS changes so items missing new fields are refetched
+    VERSION = 2
+    MAX_ENTRIES = 2000
+    
+    @staticmethod
+    def key_for(collection_url: str, work_item_id: Any) -> str:
+        """Cache key for a work item; IDs are only unique within one collection"""
+        return f"{collection_url}|{work_item_id}"
+
+class ClaudeResponseCache(JsonCache):
+    """Claude responses keyed by a hash of the prompt that produced them.
+    
+    The prompt holds every analyzed field, so an unchanged set of work items
+    reuses the previous analysis for TTL_SECONDS instead of running Claude again.
+    """
+    
+    VERSION = 1
+    MAX_ENTRIES = 20
+    TTL_SECONDS = 24 * 60 * 60
+    
+    @staticmethod
+    def key_for(prompt: str) -> str:
+        """Cache key for a Claude prompt"""
+        return hashlib.sha1(prompt.encode('utf-8')).hexdigest()
+    
+    def get_fresh(self, key: str) -> Optional[str]:
+        """Stored response for key, unless it is older than TTL_SECONDS"""
+        entry = self.get(key)
+        if entry is None or time.time() - entry[0] > self.TTL_SECONDS:
+            return None
+        return entry[1]
+    
+    def put_response(self, key: str, response: str):
+        """Store a response, stamped with the current time"""
+        self.put(key, [time.time(), response])
 
 class TFSAnalyzer:
     """Main TFS analysis class"""
     
+    # TFS accepts at most 200 IDs per work item details request
+    DETAILS_BATCH_SIZE = 200
+    DETAILS_MAX_WORKERS = 8
+    # (connect, read) seconds for TFS requests, so a stalled server cannot hang a batch
+    REQUEST_TIMEOUT = (10, 60)
+    # Only the fields the analysis reads; `$expand=all` would also ship relations and links
+    DETAILS_FIELDS = ','.join([
+        'System.Id', 'System.Title', 'System.State', 'System.WorkItemType',
+        'System.AssignedTo', 'System.Priority', 'Microsoft.VSTS.Common.Severity',
+        'System.Description', 'System.Tags', 'System.CreatedDate', 'System.ChangedDate'
+    ])
+    
+    # Keyword scans for priority and impact. Plain substring alternation, so 'fail' still
+    # matches 'failed'. Each tiered pattern classifies in one pass; the stronger tier wins
+    # wherever it occurs, so only a weaker first match needs the stronger pattern rechecked.
+    _HIGH_KEYWORDS_RE = re.compile('showstopper|critical|urgent|blocker|production|down|crash')
+    _PRIORITY_KEYWORDS_RE = re.compile(
+        '(?P<high>showstopper|critical|urgent|blocker|production|down|crash)'
+        '|(?P<medium>error|exception|fail|broken|issue)')
+    _STABILITY_KEYWORDS_RE = re.compile('crash|error|exception|fail')
+    _BUG_IMPACT_KEYWORDS_RE = re.compile('(?P<stability>crash|error|exception|fail)|(?P<ui>ui|display|visual)')
+    _CORE_KEYWORDS_RE = re.compile('performance|security|data')
+    # Characters of each description scanned for keywords; the signal is near the top and
+    # pasted logs or HTML further down only add cost and false positives
+    KEYWORD_SCAN_LIMIT = 8192
+    # Markup in HTML descriptions; replaced by spaces so it cannot match a keyword
+    _HTML_TAG_RE = re.compile(r'<[^>]*>')
+    # Bullet ("-", "*") or numbered ("1." to "9.") description lines, surrounding whitespace dropped
+    _KEY_POINT_RE = re.compile(r'^[ \t\r\f\v]*((?:[-*]|[1-9]\.)[^\n]*?)[ \t\r\f\v]*$', re.MULTILINE)
+    
+    # Priority score weights, keyed by lowercased field value
+    _STATE_WEIGHTS = MappingProxyType({
+        'in progress': 5, 'active': 4, 'new': 3,
+        'committed': 3, 'to do': 2, 'done': 1, 'closed': 1
+    })
+    _TYPE_WEIGHTS = MappingProxyType({'bug': 3, 'task': 2, 'product backlog item': 2, 'epic': 1})
+    _SEVERITY_WEIGHTS = MappingProxyType({'1 - critical': 4, '2 - high': 3, '3 - medium': 2, '4 - low': 1})
+    # Finished work needs no attention, so it skips scoring entirely
+    _TERMINAL_STATES = frozenset({'done', 'closed', 'removed'})
+    # Next step per (work item type, state); other combinations get a generic hint
+    _ACTION_RECOMMENDATIONS = MappingProxyType({
+        ('Bug', 'New'): "Investigate and reproduce the issue",
+        ('Bug', 'Active'): "Continue debugging and provide status updates",
+        ('Bug', 'In Progress'): "Focus on completing the fix",
+        ('Task', 'To Do'): "Schedule work and move to Active",
+        ('Task', 'Active'): "Continue work and provide status updates",
+        ('Task', 'In Progress'): "Focus on completing current tasks"
+    })
+    
+    # CSS class for each priority level in the HTML reports
+    _PRIORITY_CSS_CLASSES = MappingProxyType({'HIGH': 'high', 'MEDIUM': 'medium', 'LOW': 'low'})
+    
+    # Console priority tags with their ANSI colour baked in; unknown levels are printed uncoloured
+    _CONSOLE_RESET = '\033[0m'
+    _CONSOLE_PRIORITY_TAGS = MappingProxyType({
+        'HIGH': '\033[91m[HIGH]\033[0m',       # Red
+        'MEDIUM': '\033[93m[MEDIUM]\033[0m',   # Yellow
+        'LOW': '\033[92m[LOW]\033[0m',         # Green
+    })
+    
+    # Priority levels read from Claude's response, strongest first, and the whole
+    # numbers on a line that are taken as work item IDs
+    _CLAUDE_LEVELS = ('HIGH', 'MEDIUM', 'LOW')
+    _ID_TOKEN_RE = re.compile(r'\d+')
+    
+    # Fields given to Claude per work item; descriptions are stripped of markup and cut to
+    # CLAUDE_DESCRIPTION_LIMIT chars
+    CLAUDE_FIELDS = (
+        'System.Title', 'System.WorkItemType', 'System.State', 'System.AssignedTo',
+        'System.Priority', 'Microsoft.VSTS.Common.Severity', 'System.Tags', 'System.ChangedDate'
+    )
+    CLAUDE_DESCRIPTION_LIMIT = 1000
+    
+    # Setup menu choice -> default output method
+    _OUTPUT_METHOD_CHOICES = MappingProxyType({
+        '1': 'browser',
+        '2': 'html',
+        '3': 'text',
+        '4': 'console',
+        '5': 'email'
+    })
+    # Common SMTP configurations, by email domain
+    _SMTP_PRESETS = MappingProxyType({
+        'gmail.com': ('smtp.gmail.com', 587),
+        'outlook.com': ('smtp.office365.com', 587),
+        'office365.com': ('smtp.office365.com', 587),
+        'yahoo.com': ('smtp.mail.yahoo.com', 587)
+    })
+    
+    # Messages sent over one SMTP connection before it is replaced
+    SMTP_MESSAGES_PER_CONNECTION = 100
+    
+    # Seconds before a tool probe counts as failed; az can hang on network with an expired login
+    PROBE_TIMEOUT = 10
+    
+    # External tool checks: name -> (command, text the output must contain, if any)
+    TOOL_PROBES = {
+        'claude_code': (('claude-code', '--version'), None),
+        'az_account': (('az', 'account', 'show'), None),
+        'az_token': (('az', 'account', 'get-access-token', '--resource', 'https://dev.azure.com'), 'accessToken'),
+    }
+    
+    # Posted to the project-scoped WIQL endpoint, so @project resolves server-side;
+    # the remaining values are inserted as WIQL string literals, see _wiql_quote()
+    WIQL_TEMPLATE = """
+        SELECT [System.Id], [System.Title], [System.State], [System.WorkItemType],
+               [System.AssignedTo], [System.Priority], [Microsoft.VSTS.Common.Severity],
+               [System.Description], [System.Tags], [System.CreatedDate], [System.ChangedDate]
+        FROM workitems 
+        WHERE [System.TeamProject] = @project
+        AND ([System.AssignedTo] = {user}
+             OR [System.History] CONTAINS {mention})
+        AND [System.ChangedDate] >= {start_date}
+        ORDER BY [System.Priority] ASC, [System.ChangedDate] DESC
+        """
+    
     def __init__(self):
         self.config_manager = CrossPlatformConfig()
         self.config = self.config_manager.load_config()
-        self.session = requests.Session()
+        self._session = None
+        self._auth_configured = False
+        self._wit_api_url = None
+        self._output_dir = None
+        self._smtp = None
+        self._smtp_sent = 0
         self.claude_config_file = Path(__file__).parent / '.config' / 'claude-code-config.json'
+        self.analysis_cache = AnalysisCache(self.config_manager.config_dir / '.tfs-analyzer-cache.json')
+        self.work_item_cache = WorkItemCache(self.config_manager.config_dir / '.tfs-analyzer-items.json')
+        self.claude_cache = ClaudeResponseCache(self.config_manager.config_dir / '.tfs-analyzer-claude-cache.json')
+    
+    @property
+    def session(self) -> 'requests.Session':
+        """HTTP session for TFS, created on first use"""
+        if self._session is None:
+            self._session = self._create_session()
+        return self._session
+    
+    @property
+    def output_dir(self) -> Path:
+        """Directory for saved reports, resolved on first use
+        
+        $TFS_OUTPUT_DIR overrides the platform default and is created if missing.
+        """
+        if self._output_dir is None:
+            override = os.environ.get('TFS_OUTPUT_DIR')
+            if override:
+                output_dir = Path(override).expanduser()
+                output_dir.mkdir(parents=True, exist_ok=True)
+            elif sys.platform == 'win32':
+                output_dir = Path.home() / 'Documents'
+            else:
+                output_dir = Path.home() / 'Downloads'
+                if not output_dir.exists():
+                    output_dir = Path.home() / 'Documents'
+                    if not output_dir.exists():
+                        output_dir = Path.home()
+            self._output_dir = output_dir
+        return self._output_dir
+    
+    def _create_session(self) -> 'requests.Session':
+        """Create an HTTP session that reuses connections to the TFS host"""
+        requests = _import_requests()
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        # Pool sized for the concurrent detail batches; retry throttling and transient errors
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        # Work item payloads are large JSON documents; make sure TFS compresses them and
+        # answers in JSON rather than content-negotiating another representation
+        session.headers.update({'Accept-Encoding': 'gzip, deflate', 'Accept': 'application/json'})
+        return session
+    
+    def _ensure_auth(self):
+        """Attach TFS credentials to the session once per run"""
+        if self._auth_configured:
+            return
+        
+        if self.config.get('use_windows_auth', 'false').lower() == 'true':
+            # Use current user credentials (Windows/Kerberos)
+            from requests_ntlm import HttpNtlmAuth
+            import getpass
+            username = getpass.getuser()
+            self.session.auth = HttpNtlmAuth(username, '')
+        else:
+            # Use PAT authentication; the Basic header is fixed for the run, so encode it once
+            # instead of having an auth handler rebuild it for every request
+            import base64
+            token = base64.b64encode(f":{self.config['pat']}".encode('latin1')).decode('ascii')
+            self.session.headers['Authorization'] = f"Basic {token}"
+        
+        self._auth_configured = True
+    
+    def _get_wit_api_url(self) -> str:
+        """Base URL of the work item tracking API for the configured project"""
+        if self._wit_api_url is None:
+            self._wit_api_url = f"{self.config['tfs_url']}/{self.config['project_name']}/_apis/wit"
+        return self._wit_api_url
+    
+    def _collection_url(self) -> str:
+        """Configured collection URL, as the cache keys record it"""
+        return self.config.get('tfs_url', '').rstrip('/')
+    
+    @staticmethod
+    def _wiql_quote(value: str) -> str:
+        """Quote a value as a WIQL string literal, escaping embedded quotes"""
+        return "'" + value.replace("'", "''") + "'"
         
     def setup_config(self, use_windows_auth: bool = False):
         """Interactive configuration setup"""
@@ -111,20 +555,15 @@ class TFSAnalyzer:
         print("5. Email (sends via SMTP)")
         
         choice = input("Choose default output method (1-5): ").strip()
-        output_methods = {
-            '1': 'browser',
-            '2': 'html',
-            '3': 'text', 
-            '4': 'console',
-            '5': 'email'
-        }
-        config_data['default_output'] = output_methods.get(choice, 'console')
+        config_data['default_output'] = self._OUTPUT_METHOD_CHOICES.get(choice, 'console')
         
         if choice == '5':
             self._setup_email_config(config_data)
         
         self.config_manager.save_config(config_data)
         self.config = config_data
+        self._auth_configured = False
+        self._wit_api_url = None
         
         print(f"\n[OK] Configuration saved to: {self.config_manager.config_file}")
         print("Ready! Ready to analyze TFS tickets!")
@@ -135,17 +574,10 @@ class TFSAnalyzer:
         email = input("Email Address: ").strip()
         password = input("Email Password: ").strip()
         
-        # Common SMTP configurations
-        smtp_configs = {
-            'gmail.com': ('smtp.gmail.com', 587),
-            'outlook.com': ('smtp.office365.com', 587),
-            'office365.com': ('smtp.office365.com', 587),
-            'yahoo.com': ('smtp.mail.yahoo.com', 587)
-        }
-        
         domain = email.split('@')[1].lower()
-        if domain in smtp_configs:
-            smtp_server, smtp_port = smtp_configs[domain]
+        smtp_preset = self._SMTP_PRESETS.get(domain)
+        if smtp_preset:
+            smtp_server, smtp_port = smtp_preset
             print(f"Using {smtp_server}:{smtp_port} for {domain}")
         else:
             smtp_server = input("SMTP Server: ").strip()
@@ -158,6 +590,45 @@ class TFSAnalyzer:
             'smtp_port': str(smtp_port)
         })
     
+    def _probe_tools(self, names: List[str]) -> Dict[str, bool]:
+        """Run the named TOOL_PROBES concurrently and report which succeeded"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            futures = {name: executor.submit(self._run_probe, *self.TOOL_PROBES[name]) for name in names}
+            return {name: future.result() for name, future in futures.items()}
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _run_probe(command: tuple, expected_output: Optional[str] = None) -> bool:
+        """Run a tool probe command; True if it exits cleanly (with the expected output)
+        
+        Results are kept for the rest of the process, so the checks repeated by
+        main(), test_claude_configuration() and invoke_claude_analysis() only
+        spawn each tool once.
+        """
+        # A tool that is not on PATH cannot pass, so skip the fork+exec entirely
+        if shutil.which(command[0]) is None:
+            return False
+        import subprocess
+        
+        # Only read stdout when the probe has to inspect it; otherwise the exit status is enough
+        stdout = subprocess.PIPE if expected_output is not None else subprocess.DEVNULL
+        # Keep az from spawning its telemetry uploader, and from formatting output nobody reads;
+        # other tools ignore these variables
+        env = dict(os.environ, AZURE_CORE_COLLECT_TELEMETRY='false')
+        if expected_output is None:
+            env['AZURE_CORE_OUTPUT'] = 'none'
+        try:
+            result = subprocess.run(command, stdout=stdout, stderr=subprocess.DEVNULL, text=True,
+                                    env=env, timeout=TFSAnalyzer.PROBE_TIMEOUT)
+        except (OSError, subprocess.SubprocessError):
+            # Includes TimeoutExpired: a hung tool is treated as unavailable
+            return False
+        if result.returncode != 0:
+            return False
+        return expected_output is None or expected_output in (result.stdout or '')
+    
     def test_claude_configuration(self):
         """Test Claude AI configuration with interactive setup guidance"""
         print("Testing Claude AI Configuration...")
@@ -185,15 +656,13 @@ class TFSAnalyzer:
         az_auth_working = False
         pat_available = False
         
+        # Probe Azure CLI and Claude Code together; the Claude result is used in step 3
+        probes = self._probe_tools(['az_token', 'claude_code'])
+        
         # Test Azure CLI
-        try:
-            result = subprocess.run(['az', 'account', 'get-access-token', '--resource', 'https://dev.azure.com'], 
-                                  capture_output=True, text=True, check=True)
-            if result.stdout and 'accessToken' in result.stdout:
-                print("[OK] Azure CLI is authenticated and working")
-                az_auth_working = True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            pass
+        if probes['az_token']:
+            print("[OK] Azure CLI is authenticated and working")
+            az_auth_working = True
         
         # Test PAT availability  
         if self.config.get('pat') and self.config['pat'].strip():
@@ -224,6 +693,8 @@ class TFSAnalyzer:
                 print("Starting Azure CLI authentication...")
                 print("This will open your browser for authentication...")
                 
+                import subprocess
+                
                 try:
                     az_result = subprocess.run(['az', 'login', '--allow-no-subscriptions'], check=True)
                     if az_result.returncode == 0:
@@ -245,11 +716,9 @@ class TFSAnalyzer:
         print("")
         print("Testing Claude Code CLI...")
         
-        try:
-            subprocess.run(['claude-code', '--version'], 
-                         capture_output=True, check=True)
+        if probes['claude_code']:
             print("[OK] Claude Code CLI is available")
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        else:
             print("[ERROR] Claude Code CLI not found")
             print("")
             print("CLAUDE CODE INSTALLATION REQUIRED:")
@@ -265,7 +734,7 @@ class TFSAnalyzer:
         
         # Try a basic test of the authentication and MCP setup
         try:
-            success, error_msg = self.invoke_claude_analysis([], 1, "console")
+            success, error_msg = self.invoke_claude_analysis([], 1, "console", min_items=0)
             if not success and "Claude Code CLI not found" not in error_msg:
                 print("[OK] Claude AI integration is working")
                 print("")
@@ -300,12 +769,11 @@ class TFSAnalyzer:
         print("This will configure AI-powered ticket analysis with enhanced insights.")
         print()
         
-        # Step 1: Test Claude Code availability
-        try:
-            result = subprocess.run(['claude-code', '--help'], 
-                                 capture_output=True, text=True, check=True)
+        # Step 1: Test Claude Code availability (Azure CLI login is probed alongside for step 3)
+        probes = self._probe_tools(['claude_code', 'az_account'])
+        if probes['claude_code']:
             print("[OK] Claude Code CLI found")
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        else:
             print("[ERROR] Claude Code CLI not found. Please install Claude Code first:")
             print()
             print("Installation Installation Steps:")
@@ -343,16 +811,9 @@ class TFSAnalyzer:
         print()
         
         # Test available authentication methods
-        azure_cli_auth = False
+        azure_cli_auth = probes['az_account']
         pat_available = bool(self.config.get('pat'))
         
-        try:
-            subprocess.run(['az', 'account', 'show'], 
-                         capture_output=True, text=True, check=True)
-            azure_cli_auth = True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            pass
-        
         print("Default Output Method Authentication Status:")
         if azure_cli_auth:
             print("[OK] Azure CLI: Authenticated and ready")
@@ -426,16 +887,17 @@ class TFSAnalyzer:
         
         # Save Claude Code configuration
         try:
-            with open(self.claude_config_file, 'w') as f:
-                json.dump(claude_config, f, indent=4)
+            # Serialize once; the same text goes to the config and its backup
+            claude_config_text = json.dumps(claude_config, indent=4)
+            self.claude_config_file.write_text(claude_config_text)
             print(f"[OK] Claude Code MCP configuration created")
             
-            # Create backup in script directory
+            # Create backup in script directory, unless that is where the config already lives
             backup_path = Path(__file__).parent / 'claude-code-config.json'
             try:
-                with open(backup_path, 'w') as f:
-                    json.dump(claude_config, f, indent=4)
-                print(f"[OK] Backup configuration created at: {backup_path}")
+                if backup_path.resolve() != self.claude_config_file.resolve():
+                    backup_path.write_text(claude_config_text)
+                    print(f"[OK] Backup configuration created at: {backup_path}")
             except Exception:
                 pass
                 
@@ -483,25 +945,23 @@ class TFSAnalyzer:
             return False
             
         try:
-            url = f"{self.config['tfs_url']}/{self.config['project_name']}/_apis/wit/workitems?api-version=6.0"
+            url = f"{self._get_wit_api_url()}/workitems?api-version=6.0"
             
-            if self.config.get('use_windows_auth', 'false').lower() == 'true':
-                # Use current user credentials (Windows/Kerberos)
-                from requests_ntlm import HttpNtlmAuth
-                import getpass
-                username = getpass.getuser()
-                self.session.auth = HttpNtlmAuth(username, '')
-            else:
-                # Use PAT authentication
-                self.session.auth = HTTPBasicAuth('', self.config['pat'])
+            self._ensure_auth()
             
-            response = self.session.get(url)
+            # Only the status matters: stream so the body is never downloaded, and don't follow
+            # redirects to a sign-in page that would mask a rejected credential
+            with self.session.get(url, stream=True, allow_redirects=False, timeout=self.REQUEST_TIMEOUT) as response:
+                status_code = response.status_code
             
-            if response.status_code == 200:
+            if status_code == 200:
                 print("[OK] Authentication successful!")
                 return True
+            elif status_code in (401, 403):
+                print(f"[ERROR] Authentication failed: {status_code} (credentials rejected)")
+                return False
             else:
-                print(f"[ERROR] Authentication failed: {response.status_code}")
+                print(f"[ERROR] Authentication failed: {status_code}")
                 return False
                 
         except Exception as e:
@@ -521,87 +981,167 @@ class TFSAnalyzer:
             start_date = end_date - timedelta(days=timevalue)
         
         # Build WIQL query
-        wiql_query = f"""
-        SELECT [System.Id], [System.Title], [System.State], [System.WorkItemType],
-               [System.AssignedTo], [System.Priority], [Microsoft.VSTS.Common.Severity],
-               [System.Description], [System.Tags], [System.CreatedDate], [System.ChangedDate]
-        FROM workitems 
-        WHERE [System.TeamProject] = '{self.config['project_name']}'
-        AND ([System.AssignedTo] = '{self.config['user_display_name']}'
-             OR [System.History] CONTAINS '@{self.config['user_display_name']}')
-        AND [System.ChangedDate] >= '{start_date.isoformat()}'
-        ORDER BY [System.Priority] ASC, [System.ChangedDate] DESC
-        """
+        user = self.config['user_display_name']
+        wiql_query = self.WIQL_TEMPLATE.format(
+            user=self._wiql_quote(user),
+            mention=self._wiql_quote(f"@{user}"),
+            start_date=self._wiql_quote(start_date.isoformat())
+        )
         
         # Execute WIQL query
-        wiql_url = f"{self.config['tfs_url']}/{self.config['project_name']}/_apis/wit/wiql?api-version=6.0"
+        wiql_url = f"{self._get_wit_api_url()}/wiql?api-version=6.0"
         
         wiql_request = {"query": wiql_query}
         
         try:
-            response = self.session.post(wiql_url, json=wiql_request)
+            self._ensure_auth()
+            
+            response = self.session.post(wiql_url, json=wiql_request, timeout=self.REQUEST_TIMEOUT)
             response.raise_for_status()
             
-            work_items_result = response.json()
+            work_items_result = json_loads(response.content)
             work_item_ids = [item['id'] for item in work_items_result.get('workItems', [])]
             
             if not work_item_ids:
                 return []
             
-            # Get detailed work item information
-            ids_param = ','.join(map(str, work_item_ids))
-            details_url = f"{self.config['tfs_url']}/{self.config['project_name']}/_apis/wit/workitems?ids={ids_param}&$expand=all&api-version=6.0"
-            
-            details_response = self.session.get(details_url)
-            details_response.raise_for_status()
-            
-            return details_response.json().get('value', [])
+            return self._get_current_work_items(work_item_ids)
             
-        except requests.RequestException as e:
+        except (_import_requests().RequestException, ValueError) as e:
+            # ValueError: a 2xx body that is not JSON, such as a proxy or sign-in page
             print(f"[ERROR] Error retrieving work items: {e}")
             return []
     
-    def calculate_priority_score(self, work_item: Dict[str, Any]) -> tuple:
+    def _get_current_work_items(self, work_item_ids: List[int]) -> List[Dict[str, Any]]:
+        """Details for the given IDs in order, downloading only items changed since the last run"""
+        cache = self.work_item_cache
+        collection_url = self._collection_url()
+        cached = {work_item_id: cache.get(cache.key_for(collection_url, work_item_id))
+                  for work_item_id in work_item_ids}
+        
+        stale_ids = [work_item_id for work_item_id, item in cached.items() if item is None]
+        if len(stale_ids) < len(work_item_ids):
+            # Ask only for the revisions of cached items (every item carries 'rev'); unchanged ones are reused
+            current_revs = {item['id']: item.get('rev')
+                            for item in self._fetch_in_batches(
+                                [work_item_id for work_item_id, item in cached.items() if item is not None],
+                                'System.Rev')}
+            stale_ids.extend(work_item_id for work_item_id, item in cached.items()
+                             if item is not None and item.get('rev') != current_revs.get(work_item_id))
+        
+        # An item the refetch does not return (deleted, or no longer visible) is dropped
+        # rather than served from its outdated cached copy
+        for work_item_id in stale_ids:
+            cached[work_item_id] = None
+        for item in self._fetch_in_batches(stale_ids, self.DETAILS_FIELDS):
+            cached[item['id']] = item
+            cache.put(cache.key_for(collection_url, item['id']), item)
+        
+        return [item for item in cached.values() if item is not None]
+    
+    def _fetch_in_batches(self, work_item_ids: List[int], fields: str) -> List[Dict[str, Any]]:
+        """Retrieve the given fields for any number of IDs, one request per batch"""
+        # The usual case fits in one request; skip slicing the ID list into batch copies
+        if len(work_item_ids) <= self.DETAILS_BATCH_SIZE:
+            return self._get_work_item_details(work_item_ids, fields) if work_item_ids else []
+        
+        batches = [work_item_ids[i:i + self.DETAILS_BATCH_SIZE]
+                   for i in range(0, len(work_item_ids), self.DETAILS_BATCH_SIZE)]
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        # Fetch batches concurrently; map() keeps the requested ordering
+        with ThreadPoolExecutor(max_workers=min(self.DETAILS_MAX_WORKERS, len(batches))) as executor:
+            return list(chain.from_iterable(executor.map(self._get_work_item_details, batches,
+                                                         [fields] * len(batches))))
+    
+    def _get_work_item_details(self, work_item_ids: List[int], fields: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Retrieve details for a single batch of work item IDs"""
+        ids_param = ','.join(map(str, work_item_ids))
+        details_url = (f"{self._get_wit_api_url()}/workitems?ids={ids_param}"
+                       f"&fields={fields or self.DETAILS_FIELDS}&api-version=6.0")
+        
+        # Decode the (gzip) body straight from the socket instead of buffering it as text first
+        with self.session.get(details_url, stream=True, timeout=self.REQUEST_TIMEOUT) as details_response:
+            details_response.raise_for_status()
+            details_response.raw.decode_content = True
+            try:
+                return json_loads(details_response.raw.read()).get('value', [])
+            except ValueError as e:
+                # Surface a non-JSON body through the callers' RequestException handling
+                raise _import_requests().RequestException(f"Invalid work item details response: {e}") from e
+    
+    @staticmethod
+    def _plain_description(fields: Dict[str, Any]) -> str:
+        """Description with any HTML markup and entities removed"""
+        description = fields.get('System.Description', '')
+        if '<' not in description:
+            return description
+        return html.unescape(TFSAnalyzer._HTML_TAG_RE.sub(' ', description)).strip()
+    
+    @staticmethod
+    def _item_text(fields: Dict[str, Any], description: Optional[str] = None) -> str:
+        """Lowercased title and description prefix, as scanned for keywords"""
+        if description is None:
+            description = TFSAnalyzer._plain_description(fields)
+        return f"{fields.get('System.Title', '')} {description[:TFSAnalyzer.KEYWORD_SCAN_LIMIT]}".lower()
+    
+    def _score_and_analyze(self, work_item: Dict[str, Any]) -> tuple:
+        """Score and analyze a work item, reusing the cached result for an unchanged revision"""
+        cache_key = self.analysis_cache.key_for(self._collection_url(), work_item)
+        if cache_key is not None:
+            cached = self.analysis_cache.get(cache_key)
+            if cached is not None:
+                return tuple(cached)
+        
+        # Strip markup and lowercase the text only once for both passes
+        fields = work_item.get('fields', {})
+        description = self._plain_description(fields)
+        text_content = self._item_text(fields, description)
+        score, priority_level = self.calculate_priority_score(work_item, text_content)
+        analysis = self.analyze_content(work_item, text_content, description)
+        
+        if cache_key is not None:
+            self.analysis_cache.put(cache_key, [score, priority_level, analysis])
+        return score, priority_level, analysis
+    
+    def calculate_priority_score(self, work_item: Dict[str, Any], text_content: Optional[str] = None) -> tuple:
         """Calculate priority score and classification"""
         fields = work_item.get('fields', {})
+        get_field = fields.get
         score = 0
         
         # State weight
-        state = fields.get('System.State', '').lower()
-        state_weights = {
-            'in progress': 5, 'active': 4, 'new': 3, 
-            'committed': 3, 'to do': 2, 'done': 1, 'closed': 1
-        }
-        score += state_weights.get(state, 0)
+        state = get_field('System.State', '').lower()
+        if state in self._TERMINAL_STATES:
+            return 0, "LOW"
+        score += self._STATE_WEIGHTS.get(state, 0)
         
         # Work item type weight
-        work_type = fields.get('System.WorkItemType', '').lower()
-        type_weights = {'bug': 3, 'task': 2, 'product backlog item': 2, 'epic': 1}
-        score += type_weights.get(work_type, 0)
+        work_type = get_field('System.WorkItemType', '').lower()
+        score += self._TYPE_WEIGHTS.get(work_type, 0)
         
         # Priority field
-        priority = fields.get('System.Priority')
+        priority = get_field('System.Priority')
         if priority:
             score += max(0, 5 - int(priority))
         
         # Severity field
-        severity = fields.get('Microsoft.VSTS.Common.Severity')
+        severity = get_field('Microsoft.VSTS.Common.Severity')
         if severity:
-            severity_weights = {'1 - critical': 4, '2 - high': 3, '3 - medium': 2, '4 - low': 1}
-            score += severity_weights.get(severity.lower(), 0)
+            score += self._SEVERITY_WEIGHTS.get(severity.lower(), 0)
         
         # Keyword analysis
-        title = fields.get('System.Title', '').lower()
-        description = fields.get('System.Description', '').lower()
-        text_content = f"{title} {description}"
-        
-        high_keywords = ['showstopper', 'critical', 'urgent', 'blocker', 'production', 'down', 'crash']
-        medium_keywords = ['error', 'exception', 'fail', 'broken', 'issue']
-        
-        if any(keyword in text_content for keyword in high_keywords):
-            score += 3
-        elif any(keyword in text_content for keyword in medium_keywords):
-            score += 2
+        if text_content is None:
+            text_content = self._item_text(fields)
+        
+        match = self._PRIORITY_KEYWORDS_RE.search(text_content)
+        if match:
+            # No high keyword starts before a medium first match, so resume from there
+            if match.lastgroup == 'high' or self._HIGH_KEYWORDS_RE.search(text_content, match.start()):
+                score += 3
+            else:
+                score += 2
         
         # Classify priority
         if score >= 8:
@@ -613,20 +1153,23 @@ class TFSAnalyzer:
             
         return score, priority_level
     
-    def analyze_content(self, work_item: Dict[str, Any]) -> Dict[str, str]:
+    def analyze_content(self, work_item: Dict[str, Any], text_content: Optional[str] = None,
+                        description: Optional[str] = None) -> Dict[str, str]:
         """Perform intelligent content analysis"""
         fields = work_item.get('fields', {})
+        get_field = fields.get
         
-        title = fields.get('System.Title', '')
-        description = fields.get('System.Description', '')
-        work_type = fields.get('System.WorkItemType', '')
-        state = fields.get('System.State', '')
+        title = get_field('System.Title', '')
+        if description is None:
+            description = self._plain_description(fields)
+        work_type = get_field('System.WorkItemType', '')
+        state = get_field('System.State', '')
         
         analysis = {
             'summary': f"{work_type}: {title}",
             'key_points': self._extract_key_points(description),
             'action_items': self._get_action_recommendation(work_type, state),
-            'impact_assessment': self._assess_impact(work_type, title, description)
+            'impact_assessment': self._assess_impact(work_type, title, description, text_content)
         }
         
         return analysis
@@ -636,75 +1179,96 @@ class TFSAnalyzer:
         if not description:
             return "No description provided"
         
-        # Simple extraction - look for bullet points, numbered lists, or key phrases
-        lines = description.split('\n')
-        key_lines = []
-        
-        for line in lines:
-            line = line.strip()
-            if (line.startswith('-') or line.startswith('*') or 
-                line.startswith('-') or any(line.startswith(f"{i}.") for i in range(1, 10))):
-                key_lines.append(line)
+        # Simple extraction - look for bullet points or numbered lists
+        # Only the first five are shown, so stop scanning once they are found
+        key_lines = [match.group(1) for match in islice(self._KEY_POINT_RE.finditer(description), 5)]
         
-        return '\n'.join(key_lines[:5]) if key_lines else description[:200] + "..."
+        return '\n'.join(key_lines) if key_lines else description[:200] + "..."
     
-    def _get_action_recommendation(self, work_type: str, state: str) -> str:
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _get_action_recommendation(cls, work_type: str, state: str) -> str:
         """Get action recommendation based on work item type and state"""
-        recommendations = {
-            ('Bug', 'New'): "Investigate and reproduce the issue",
-            ('Bug', 'Active'): "Continue debugging and provide status updates",
-            ('Bug', 'In Progress'): "Focus on completing the fix",
-            ('Task', 'To Do'): "Schedule work and move to Active",
-            ('Task', 'Active'): "Continue work and provide status updates", 
-            ('Task', 'In Progress'): "Focus on completing current tasks"
-        }
-        
-        return recommendations.get((work_type, state), f"Continue work on {work_type.lower()}")
+        return cls._ACTION_RECOMMENDATIONS.get((work_type, state), f"Continue work on {work_type.lower()}")
     
-    def _assess_impact(self, work_type: str, title: str, description: str) -> str:
+    def _assess_impact(self, work_type: str, title: str, description: str, text: Optional[str] = None) -> str:
         """Assess potential impact of the work item"""
-        text = f"{title} {description}".lower()
+        if text is None:
+            text = f"{title} {description[:self.KEYWORD_SCAN_LIMIT]}".lower()
         
         if work_type.lower() == 'bug':
-            if any(word in text for word in ['crash', 'error', 'exception', 'fail']):
-                return "High - Potential system stability impact"
-            elif any(word in text for word in ['ui', 'display', 'visual']):
-                return "Medium - User experience impact"
-            else:
+            match = self._BUG_IMPACT_KEYWORDS_RE.search(text)
+            if match is None:
                 return "Low to Medium - Functional impact"
+            if match.lastgroup == 'stability' or self._STABILITY_KEYWORDS_RE.search(text, match.start()):
+                return "High - Potential system stability impact"
+            return "Medium - User experience impact"
         else:
-            if any(word in text for word in ['performance', 'security', 'data']):
+            if self._CORE_KEYWORDS_RE.search(text):
                 return "High - Core system impact"
             else:
                 return "Medium - Feature/functionality impact"
     
-    def invoke_claude_analysis(self, work_items: List[Dict[str, Any]], days: int, output_type: str) -> tuple[bool, str]:
-        """Invoke Claude AI for enhanced analysis"""
+    def invoke_claude_analysis(self, work_items: List[Dict[str, Any]], days: int, output_type: str,
+                               min_items: Optional[int] = None) -> tuple[bool, str]:
+        """Invoke Claude AI for enhanced analysis
+        
+        min_items defaults to the claude_min_items setting; the self-test passes 0
+        so it always exercises the CLI.
+        """
         # Count total work items for progress indication
         total_count = len(work_items)
         
+        # Claude Code's start-up costs seconds, which smaller runs can skip (claude_min_items)
+        if min_items is None:
+            try:
+                min_items = int(self.config.get('claude_min_items', '1'))
+            except ValueError:
+                min_items = 1
+        if total_count < min_items:
+            return False, f"Only {total_count} ticket(s); Claude analysis is configured to start at {min_items}"
+        
+        # Create analysis request
+        analysis_request = f"""
+Please analyze the following TFS work items from the last {days} days and provide:
+
+1. Enhanced Priority Analysis - Review each work item and provide intelligent priority rankings
+2. Action Recommendations - Suggest specific next steps for each item  
+3. Risk Assessment - Identify potential risks or blockers
+4. Summary Insights - Overall patterns and key focus areas
+
+Work Items Data:
+{json_dumps(self._project_for_claude(work_items))}
+
+Please format the response as structured analysis with clear sections for each work item, including priority level (HIGH/MEDIUM/LOW), recommended actions, and risk factors.
+"""
+        
+        # The same items and time range as a recent run: reuse that analysis instead of asking again
+        cache_key = self.claude_cache.key_for(analysis_request)
+        cached_response = self.claude_cache.get_fresh(cache_key)
+        if cached_response is not None:
+            print(f"[OK] Reusing Claude AI analysis of these {total_count} ticket(s) from an earlier run")
+            self._generate_enhanced_output(work_items, cached_response, days, output_type)
+            return True, ""
+        
         # Progress indicator setup
         print(f"Claude AI will analyze {total_count} ticket(s) for enhanced insights...")
         print("  [INFO] This may take a few minutes depending on ticket count and complexity", file=sys.stderr)
         print("  [AI] Analyzing all tickets with Claude AI...", end="", flush=True, file=sys.stderr)
         
-        # Step 1: Verify Claude Code is available
-        try:
-            subprocess.run(['claude-code', '--version'], 
-                         capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        # Step 1: Verify Claude Code is available (Azure CLI login is probed alongside for step 2)
+        probes = self._probe_tools(['claude_code', 'az_account'])
+        if not probes['claude_code']:
             error_msg = "Claude Code CLI not found. Run setup-claude first."
             return False, error_msg
         
         # Step 2: Verify authentication
         auth_available = False
-        try:
+        if probes['az_account']:
             # Try Azure CLI first
-            subprocess.run(['az', 'account', 'show'], 
-                         capture_output=True, text=True, check=True)
             print("[OK] Using Azure CLI authentication for Claude analysis")
             auth_available = True
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        else:
             # Fall back to PAT
             if self.config.get('pat'):
                 print("[OK] Using Personal Access Token for Claude analysis")
@@ -723,48 +1287,38 @@ class TFSAnalyzer:
             print("[WARNING]  Claude Code MCP configuration not found. This may cause issues.")
             print(f"Consider running: python {Path(__file__).name} --setup-claude")
         
-        # Create analysis request
-        analysis_request = f"""
-Please analyze the following TFS work items from the last {days} days and provide:
-
-1. Enhanced Priority Analysis - Review each work item and provide intelligent priority rankings
-2. Action Recommendations - Suggest specific next steps for each item  
-3. Risk Assessment - Identify potential risks or blockers
-4. Summary Insights - Overall patterns and key focus areas
-
-Work Items Data:
-{json.dumps(work_items, indent=2)}
-
-Please format the response as structured analysis with clear sections for each work item, including priority level (HIGH/MEDIUM/LOW), recommended actions, and risk factors.
-"""
-        
-        # Create temporary files
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as temp_request:
-            temp_request.write(analysis_request)
-            temp_request_path = temp_request.name
+        import subprocess
         
         try:
-            # Invoke Claude Code using stdin with timeout
-            result = subprocess.run(
-                ['claude-code', '--print', '--output-format', 'json'], 
-                input=analysis_request,
-                capture_output=True, 
-                text=True,
-                timeout=120
-            )
+            # Invoke Claude Code, piping the request straight to its stdin
+            with subprocess.Popen(
+                ['claude-code', '--print', '--output-format', 'json'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True
+            ) as process:
+                try:
+                    stdout, stderr = process.communicate(input=analysis_request, timeout=120)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.communicate()
+                    raise
             
-            if result.returncode == 0 and result.stdout.strip():
+            claude_response = self._claude_result_text(stdout) if process.returncode == 0 else ''
+            if claude_response.strip():
                 print(" Done", file=sys.stderr)
                 print(f"[OK] Claude AI analysis completed for all {total_count} tickets!")
+                self.claude_cache.put_response(cache_key, claude_response)
                 
                 # Generate enhanced output
-                self._generate_enhanced_output(work_items, result.stdout, days, output_type)
+                self._generate_enhanced_output(work_items, claude_response, days, output_type)
                 return True, ""
             else:
                 print(" Failed", file=sys.stderr)
                 error_msg = "Claude returned empty response"
-                if result.stderr:
-                    error_detail = ' '.join(result.stderr.split('\n')[:3]).strip()
+                if stderr:
+                    error_detail = ' '.join(stderr.split('\n')[:3]).strip()
                     if error_detail:
                         error_msg = f"{error_msg}: {error_detail}"
                 return False, error_msg
@@ -777,12 +1331,39 @@ Please format the response as structured analysis with clear sections for each w
             print(" Failed", file=sys.stderr)
             error_msg = f"Claude Code execution failed: {str(e)}"
             return False, error_msg
-        finally:
-            # Cleanup
-            try:
-                os.unlink(temp_request_path)
-            except:
-                pass
+    
+    @staticmethod
+    def _claude_result_text(stdout: str) -> str:
+        """Claude's answer from `--output-format json` output, or the output itself if it is plain text"""
+        # The JSON envelope escapes the answer's newlines; the reports scan it line by line
+        try:
+            envelope = json_loads(stdout)
+        except ValueError:
+            return stdout
+        if isinstance(envelope, dict) and isinstance(envelope.get('result'), str):
+            return envelope['result']
+        return stdout
+    
+    @classmethod
+    def _project_for_claude(cls, work_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Reduce work items to the fields the Claude prompt needs"""
+        projected = []
+        for item in work_items:
+            fields = item.get('fields', {})
+            slim_fields = {name: fields[name] for name in cls.CLAUDE_FIELDS if name in fields}
+            
+            # Identity fields carry avatars and links; the name is enough
+            assigned_to = slim_fields.get('System.AssignedTo')
+            if isinstance(assigned_to, dict):
+                slim_fields['System.AssignedTo'] = assigned_to.get('displayName', '')
+            
+            # Cut the plain text, so the limit is spent on content and never splits a tag or entity
+            description = cls._plain_description(fields)
+            if description:
+                slim_fields['System.Description'] = description[:cls.CLAUDE_DESCRIPTION_LIMIT]
+            
+            projected.append({'id': item.get('id'), 'fields': slim_fields})
+        return projected
     
     def _generate_enhanced_output(self, work_items: List[Dict[str, Any]], claude_response: str, days: int, output_type: str):
         """Generate enhanced output with Claude AI insights"""
@@ -799,8 +1380,80 @@ Please format the response as structured analysis with clear sections for each w
         else:
             self._generate_enhanced_console_output(work_items, claude_response, days)
     
+    def _enhance_work_items(self, work_items: List[Dict[str, Any]], claude_response: str) -> List[EnhancedRow]:
+        """Score each work item and merge in Claude's priority, flattening the fields once for every renderer"""
+        # Read Claude's priorities for all items in one pass over its response
+        claude_priorities = self._claude_priorities(claude_response)
+        rows = []
+        for item in work_items:
+            work_item_id = str(item.get('id', ''))
+            fields = item.get('fields', {})
+            get_field = fields.get
+            
+            # Traditional priority is the fallback when Claude does not rate the item
+            score, traditional_priority, analysis = self._score_and_analyze(item)
+            claude_priority = claude_priorities.get(work_item_id)
+            
+            rows.append(EnhancedRow(
+                id=work_item_id,
+                title=get_field('System.Title', 'No Title'),
+                work_type=get_field('System.WorkItemType', 'Unknown'),
+                state=get_field('System.State', 'Unknown'),
+                assigned_to=get_field('System.AssignedTo', 'Unassigned'),
+                score=score,
+                traditional_level=traditional_priority,
+                level=claude_priority if claude_priority else traditional_priority,
+                claude_assessed=bool(claude_priority),
+                source="Claude AI Assessment" if claude_priority else "Traditional Analysis",
+                action=analysis['action_items']
+            ))
+        return rows
+    
+    @classmethod
+    def _claude_priorities(cls, claude_response: str) -> Dict[str, str]:
+        """Claude's priority level for every work item ID mentioned in its response
+        
+        An ID takes the level named in the context of its first mention that has
+        one: from 5 lines before the mention to 9 lines after, HIGH over MEDIUM over
+        LOW. IDs are whole numbers on a line, so 12 is not found inside 123. The ''
+        key holds the level of the first context with one, for items without an ID.
+        """
+        priorities = {}
+        if not claude_response:
+            return priorities
+        
+        lines = claude_response.split('\n')
+        upper_lines = [line.upper() for line in lines]
+        
+        def context_level(i: int) -> Optional[str]:
+            """Strongest level named within the context around line i"""
+            context = upper_lines[max(0, i - 5):i + 10]
+            return next((level for level in cls._CLAUDE_LEVELS
+                         if any(level in line for line in context)), None)
+        
+        for i, line in enumerate(lines):
+            # Only a first mention with a level counts, so skip IDs already rated
+            new_ids = [token for token in cls._ID_TOKEN_RE.findall(line) if token not in priorities]
+            if not new_ids and '' in priorities:
+                continue
+            level = context_level(i)
+            if level is None:
+                continue
+            priorities.setdefault('', level)
+            for work_item_id in new_ids:
+                priorities[work_item_id] = level
+        return priorities
+    
+    @staticmethod
+    def _head_lines(text: str, limit: int):
+        """First `limit` lines of text, plus whether any lines follow them"""
+        # maxsplit stops scanning after the head instead of splitting the whole response
+        lines = text.split('\n', limit)
+        return lines[:limit], len(lines) > limit
+    
     def _generate_enhanced_console_output(self, work_items: List[Dict[str, Any]], claude_response: str, days: int):
         """Generate enhanced console output with Claude insights"""
+        self._enable_console_colors()
         print(f"\nClaude AI Integration Setup TFS Ticket Analysis with Claude AI - Last {days} days")
         print("=" * 70)
         print(f"Schedule Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -812,11 +1465,11 @@ Please format the response as structured analysis with clear sections for each w
         print("Claude AI Features Claude AI Insights:")
         print("-" * 30)
         # Show first 20 lines of Claude's response
-        claude_lines = claude_response.split('\n')[:20]
+        claude_lines, has_more = self._head_lines(claude_response, 20)
         for line in claude_lines:
             if line.strip():
                 print(f"   {line}")
-        if len(claude_response.split('\n')) > 20:
+        if has_more:
             print("   ... (see detailed analysis in full report)")
         print()
         
@@ -828,216 +1481,159 @@ Please format the response as structured analysis with clear sections for each w
         print("Enhanced Work Items Analysis:")
         print("=" * 40)
         
-        priority_colors = {
-            'HIGH': '\033[91m',     # Red
-            'MEDIUM': '\033[93m',   # Yellow  
-            'LOW': '\033[92m',      # Green
-        }
-        reset_color = '\033[0m'
+        priority_tags = self._CONSOLE_PRIORITY_TAGS
+        reset_color = self._CONSOLE_RESET
         
-        for item in work_items:
-            work_item_id = str(item.get('id', ''))
-            fields = item.get('fields', {})
-            
-            # Get traditional priority as fallback
-            traditional_score, traditional_priority = self.calculate_priority_score(item)
-            
-            # Try to extract Claude's priority assessment for this work item ID
-            claude_priority = None
-            priority_source = "Traditional Analysis"
+        # Build every block first and write them out in one call instead of several prints per item
+        parts = []
+        for row in self._enhance_work_items(work_items, claude_response):
+            tag = priority_tags.get(row.level) or f"[{row.level}]{reset_color}"
             
-            if claude_response:
-                # Look for this work item ID in Claude's response
-                lines = claude_response.split('\n')
-                for i, line in enumerate(lines):
-                    if work_item_id in line or f"#{work_item_id}" in line or f"ID: {work_item_id}" in line:
-                        # Check surrounding lines for priority keywords
-                        context_start = max(0, i - 5)
-                        context_end = min(len(lines), i + 10)
-                        context_section = '\n'.join(lines[context_start:context_end])
-                        
-                        if 'HIGH' in context_section.upper():
-                            claude_priority = 'HIGH'
-                            priority_source = "Claude AI Assessment"
-                            break
-                        elif 'MEDIUM' in context_section.upper():
-                            claude_priority = 'MEDIUM'
-                            priority_source = "Claude AI Assessment"
-                            break
-                        elif 'LOW' in context_section.upper():
-                            claude_priority = 'LOW'
-                            priority_source = "Claude AI Assessment"
-                            break
-            
-            # Use Claude's priority if available, otherwise use traditional
-            final_priority = claude_priority if claude_priority else traditional_priority
-            
-            color = priority_colors.get(final_priority, '')
-            
-            print(f"{color}[{final_priority}]{reset_color} {fields.get('System.Title', 'No Title')}")
-            print(f"   Type: {fields.get('System.WorkItemType', 'Unknown')}")
-            print(f"   State: {fields.get('System.State', 'Unknown')}")
-            print(f"   ID: {work_item_id}")
-            print(f"   Priority Source: {priority_source}")
-            if claude_priority:
-                print(f"   Traditional Score: {traditional_score} ({traditional_priority})")
-            print(f"   Score: {traditional_score}")
-            
-            analysis = self.analyze_content(item)
-            print(f"   Action: {analysis['action_items']}")
-            print()
+            parts.append(f"{tag} {row.title}\n"
+                         f"   Type: {row.work_type}\n"
+                         f"   State: {row.state}\n"
+                         f"   ID: {row.id}\n"
+                         f"   Priority Source: {row.source}\n")
+            if row.claude_assessed:
+                parts.append(f"   Traditional Score: {row.score} ({row.traditional_level})\n")
+            parts.append(f"   Score: {row.score}\n"
+                         f"   Action: {row.action}\n\n")
+        sys.stdout.write(''.join(parts))
     
     def _generate_enhanced_html_output(self, work_items: List[Dict[str, Any]], claude_response: str, days: int, open_browser: bool = False):
         """Generate enhanced HTML output with Claude priority integration"""
-        output_file = f"/tmp/tfs_enhanced_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+        # One clock reading names the file and stamps the report
+        generated_at = datetime.now()
+        output_file = self.output_dir / f"tfs_enhanced_analysis_{generated_at.strftime('%Y%m%d_%H%M%S')}.html"
+        
+        enhanced_rows = self._enhance_work_items(work_items, claude_response)
         
         # Count priorities for summary (using Claude priorities when available)
-        high_count = medium_count = low_count = 0
-        enhanced_items = []
+        priority_counts = Counter(row.level for row in enhanced_rows)
+        with open(output_file, 'wb') as f:
+            f.writelines(fragment.encode('utf-8') for fragment in self._iter_enhanced_html_report(
+                enhanced_rows, claude_response, priority_counts, generated_at))
         
-        for item in work_items:
-            work_item_id = str(item.get('id', ''))
-            traditional_score, traditional_priority = self.calculate_priority_score(item)
-            
-            # Try to extract Claude's priority assessment
-            claude_priority = None
-            priority_source = "Traditional Analysis"
-            
-            if claude_response:
-                lines = claude_response.split('\n')
-                for i, line in enumerate(lines):
-                    if work_item_id in line or f"#{work_item_id}" in line or f"ID: {work_item_id}" in line:
-                        context_start = max(0, i - 5)
-                        context_end = min(len(lines), i + 10)
-                        context_section = '\n'.join(lines[context_start:context_end])
-                        
-                        if 'HIGH' in context_section.upper():
-                            claude_priority = 'HIGH'
-                            priority_source = "Claude AI Assessment"
-                            break
-                        elif 'MEDIUM' in context_section.upper():
-                            claude_priority = 'MEDIUM'
-                            priority_source = "Claude AI Assessment"
-                            break
-                        elif 'LOW' in context_section.upper():
-                            claude_priority = 'LOW'
-                            priority_source = "Claude AI Assessment"
-                            break
-            
-            final_priority = claude_priority if claude_priority else traditional_priority
-            
-            # Count for summary
-            if final_priority == 'HIGH':
-                high_count += 1
-            elif final_priority == 'MEDIUM':
-                medium_count += 1
-            else:
-                low_count += 1
-                
-            enhanced_items.append({
-                'item': item,
-                'final_priority': final_priority,
-                'priority_source': priority_source,
-                'traditional_score': traditional_score
-            })
+        print(f"Enhanced HTML report generated: {output_file}")
         
-        html_template = f'''<!DOCTYPE html>
+        if open_browser:
+            import webbrowser
+            webbrowser.open(f'file://{output_file.absolute()}')
+            print("Enhanced report opened in browser")
+    
+    # Static <head> of the Claude-enhanced HTML report
+    _ENHANCED_HTML_HEAD = '''<!DOCTYPE html>
 <html>
 <head>
     <title>Enhanced TFS Ticket Analysis with Claude AI</title>
     <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }}
-        .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 8px; }}
-        .header {{ text-align: center; color: #333; border-bottom: 2px solid #0078d4; padding-bottom: 10px; }}
-        .summary {{ display: flex; justify-content: space-around; margin: 20px 0; }}
-        .summary-card {{ padding: 15px; border-radius: 5px; text-align: center; color: white; }}
-        .summary-high {{ background: #dc3545; }}
-        .summary-medium {{ background: #ffc107; color: #212529; }}
-        .summary-low {{ background: #28a745; }}
-        .work-item {{ margin: 15px 0; padding: 15px; border-radius: 5px; border-left: 5px solid #ccc; background: #fafafa; }}
-        .high {{ border-left-color: #dc3545; }}
-        .medium {{ border-left-color: #ffc107; }}
-        .low {{ border-left-color: #28a745; }}
-        .priority {{ font-weight: bold; padding: 4px 8px; border-radius: 4px; color: white; display: inline-block; }}
-        .priority.high {{ background: #dc3545; }}
-        .priority.medium {{ background: #ffc107; color: #212529; }}
-        .priority.low {{ background: #28a745; }}
-        .title {{ font-size: 18px; font-weight: bold; margin: 10px 0; }}
-        .details {{ color: #666; font-size: 14px; }}
-        .claude-insights {{ background: #e7f3ff; padding: 10px; border-radius: 5px; margin: 10px 0; }}
+        body { font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }
+        .container { max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 8px; }
+        .header { text-align: center; color: #333; border-bottom: 2px solid #0078d4; padding-bottom: 10px; }
+        .summary { display: flex; justify-content: space-around; margin: 20px 0; }
+        .summary-card { padding: 15px; border-radius: 5px; text-align: center; color: white; }
+        .summary-high { background: #dc3545; }
+        .summary-medium { background: #ffc107; color: #212529; }
+        .summary-low { background: #28a745; }
+        .work-item { margin: 15px 0; padding: 15px; border-radius: 5px; border-left: 5px solid #ccc; background: #fafafa; }
+        .high { border-left-color: #dc3545; }
+        .medium { border-left-color: #ffc107; }
+        .low { border-left-color: #28a745; }
+        .priority { font-weight: bold; padding: 4px 8px; border-radius: 4px; color: white; display: inline-block; }
+        .priority.high { background: #dc3545; }
+        .priority.medium { background: #ffc107; color: #212529; }
+        .priority.low { background: #28a745; }
+        .title { font-size: 18px; font-weight: bold; margin: 10px 0; }
+        .details { color: #666; font-size: 14px; }
+        .claude-insights { background: #e7f3ff; padding: 10px; border-radius: 5px; margin: 10px 0; }
     </style>
 </head>
-<body>
+'''
+    
+    # One work item of the enhanced HTML report, filled with str.format_map
+    _ENHANCED_HTML_ROW_TEMPLATE = '''
+    <div class="work-item {priority}">
+        <span class="priority {priority}">{level}</span>
+        <div class="title">{title}</div>
+        <div class="details">
+            <strong>Type:</strong> {work_type} | 
+            <strong>State:</strong> {state} | 
+            <strong>ID:</strong> {id_label} | 
+            <strong>Score:</strong> {score}<br>
+            <strong>Priority Source:</strong> {source}<br>
+            <strong>Assigned To:</strong> {assigned_to}<br>
+            <strong>URL:</strong> <a href="{tfs_url}/_workitems/edit/{id}" target="_blank">View in TFS</a>
+        </div>
+    </div>'''
+    
+    def _iter_enhanced_html_report(self, enhanced_rows: List[EnhancedRow], claude_response: str,
+                                   priority_counts: Dict[str, int], generated_at: datetime) -> Iterator[str]:
+        """Yield enhanced HTML report content in fragments (header, one per work item, footer)"""
+        # First lines of Claude's response for the insights panel
+        claude_head = html.escape('\n'.join(self._head_lines(claude_response, 10)[0]))
+        
+        yield self._ENHANCED_HTML_HEAD
+        yield f'''<body>
     <div class="container">
         <div class="header">
             <h1>Enhanced TFS Ticket Analysis with Claude AI</h1>
-            <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Enhanced with Claude AI Priority Assessment</p>
+            <p>Generated: {generated_at.strftime('%Y-%m-%d %H:%M:%S')} | Enhanced with Claude AI Priority Assessment</p>
         </div>
         
         <div class="summary">
-            <div class="summary-card summary-high">High Priority: {high_count}</div>
-            <div class="summary-card summary-medium">Medium Priority: {medium_count}</div>
-            <div class="summary-card summary-low">Low Priority: {low_count}</div>
+            <div class="summary-card summary-high">High Priority: {priority_counts['HIGH']}</div>
+            <div class="summary-card summary-medium">Medium Priority: {priority_counts['MEDIUM']}</div>
+            <div class="summary-card summary-low">Low Priority: {priority_counts['LOW']}</div>
         </div>
         
         <div class="claude-insights">
             <h3>Claude AI Insights</h3>
-            <pre>{"".join(claude_response.split("\\n")[:10])}</pre>
+            <pre>{claude_head}</pre>
         </div>
         
         <h2>Work Items with Enhanced Priority Analysis</h2>'''
         
-        for enhanced_item in enhanced_items:
-            item = enhanced_item['item']
-            fields = item.get('fields', {})
-            final_priority = enhanced_item['final_priority']
-            priority_source = enhanced_item['priority_source']
-            traditional_score = enhanced_item['traditional_score']
-            priority_class = final_priority.lower()
-            
-            html_template += f'''
-    <div class="work-item {priority_class}">
-        <span class="priority {priority_class}">{final_priority}</span>
-        <div class="title">{fields.get('System.Title', 'No Title')}</div>
-        <div class="details">
-            <strong>Type:</strong> {fields.get('System.WorkItemType', 'Unknown')} | 
-            <strong>State:</strong> {fields.get('System.State', 'Unknown')} | 
-            <strong>ID:</strong> {item.get('id', 'Unknown')} | 
-            <strong>Score:</strong> {traditional_score}<br>
-            <strong>Priority Source:</strong> {priority_source}<br>
-            <strong>Assigned To:</strong> {fields.get('System.AssignedTo', 'Unassigned')}<br>
-            <strong>URL:</strong> <a href="{self.config.get('tfs_url', '')}/_workitems/edit/{item.get('id', '')}" target="_blank">View in TFS</a>
-        </div>
-    </div>'''
+        row_template = self._ENHANCED_HTML_ROW_TEMPLATE
+        css_classes = self._PRIORITY_CSS_CLASSES
+        tfs_url = html.escape(self.config.get('tfs_url', ''))
+        escape = html.escape
+        for row in enhanced_rows:
+            # Work item text is user-entered; escape each field once for this row
+            work_item_id = escape(row.id)
+            yield row_template.format_map({
+                'priority': css_classes.get(row.level) or row.level.lower(),
+                'level': row.level,
+                'title': escape(row.title),
+                'work_type': escape(row.work_type),
+                'state': escape(row.state),
+                'id': work_item_id,
+                'id_label': work_item_id or 'Unknown',
+                'score': row.score,
+                'source': row.source,
+                'assigned_to': escape(str(row.assigned_to)),
+                'tfs_url': tfs_url,
+            })
         
-        html_template += '''
+        yield '''
     </div>
 </body>
 </html>'''
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_template)
-        
-        print(f"Enhanced HTML report generated: {output_file}")
-        
-        if open_browser:
-            import webbrowser
-            webbrowser.open(f'file://{output_file}')
-            print("Enhanced report opened in browser")
     
     def _generate_enhanced_text_output(self, work_items: List[Dict[str, Any]], claude_response: str, days: int):
         """Generate enhanced text output with Claude priority integration"""
-        output_file = f"/tmp/tfs_enhanced_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        # One clock reading names the file and stamps the report
+        generated_at = datetime.now()
+        output_file = self.output_dir / f"tfs_enhanced_analysis_{generated_at.strftime('%Y%m%d_%H%M%S')}.txt"
         
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write("Enhanced TFS Ticket Analysis with Claude AI\n")
             f.write("=" * 50 + "\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write(f"Generated: {generated_at.strftime('%Y-%m-%d %H:%M:%S')}\n")
             f.write("Enhanced with Claude AI Priority Assessment\n\n")
             
             f.write("Claude AI Insights:\n")
             f.write("-" * 20 + "\n")
-            claude_lines = claude_response.split('\n')[:10]
+            claude_lines, _ = self._head_lines(claude_response, 10)
             for line in claude_lines:
                 if line.strip():
                     f.write(f"   {line}\n")
@@ -1047,73 +1643,43 @@ Please format the response as structured analysis with clear sections for each w
             f.write("=" * 45 + "\n\n")
             
             # Count priorities for summary
-            high_count = medium_count = low_count = 0
+            priority_counts = Counter()
             
-            for item in work_items:
-                work_item_id = str(item.get('id', ''))
-                fields = item.get('fields', {})
-                traditional_score, traditional_priority = self.calculate_priority_score(item)
-                
-                # Try to extract Claude's priority assessment
-                claude_priority = None
-                priority_source = "Traditional Analysis"
-                
-                if claude_response:
-                    lines = claude_response.split('\n')
-                    for i, line in enumerate(lines):
-                        if work_item_id in line or f"#{work_item_id}" in line or f"ID: {work_item_id}" in line:
-                            context_start = max(0, i - 5)
-                            context_end = min(len(lines), i + 10)
-                            context_section = '\n'.join(lines[context_start:context_end])
-                            
-                            if 'HIGH' in context_section.upper():
-                                claude_priority = 'HIGH'
-                                priority_source = "Claude AI Assessment"
-                                break
-                            elif 'MEDIUM' in context_section.upper():
-                                claude_priority = 'MEDIUM'
-                                priority_source = "Claude AI Assessment"
-                                break
-                            elif 'LOW' in context_section.upper():
-                                claude_priority = 'LOW'
-                                priority_source = "Claude AI Assessment"
-                                break
-                
-                final_priority = claude_priority if claude_priority else traditional_priority
-                
-                # Count for summary
-                if final_priority == 'HIGH':
-                    high_count += 1
-                elif final_priority == 'MEDIUM':
-                    medium_count += 1
-                else:
-                    low_count += 1
-                
-                f.write(f"[{final_priority}] {fields.get('System.Title', 'No Title')}\n")
-                f.write(f"   Type: {fields.get('System.WorkItemType', 'Unknown')}\n")
-                f.write(f"   State: {fields.get('System.State', 'Unknown')}\n")
-                f.write(f"   ID: {work_item_id}\n")
-                f.write(f"   Priority Source: {priority_source}\n")
-                if claude_priority:
-                    f.write(f"   Traditional Score: {traditional_score} ({traditional_priority})\n")
-                f.write(f"   Score: {traditional_score}\n")
+            tfs_url = self.config.get('tfs_url', '')
+            for row in self._enhance_work_items(work_items, claude_response):
+                priority_counts[row.level] += 1
                 
-                analysis = self.analyze_content(item)
-                f.write(f"   Action: {analysis['action_items']}\n")
-                f.write(f"   URL: {self.config.get('tfs_url', '')}/_workitems/edit/{work_item_id}\n")
+                f.write(f"[{row.level}] {row.title}\n")
+                f.write(f"   Type: {row.work_type}\n")
+                f.write(f"   State: {row.state}\n")
+                f.write(f"   ID: {row.id}\n")
+                f.write(f"   Priority Source: {row.source}\n")
+                if row.claude_assessed:
+                    f.write(f"   Traditional Score: {row.score} ({row.traditional_level})\n")
+                f.write(f"   Score: {row.score}\n")
+                f.write(f"   Action: {row.action}\n")
+                f.write(f"   URL: {tfs_url}/_workitems/edit/{row.id}\n")
                 f.write("\n")
             
             f.write("\nSUMMARY:\n")
             f.write("-" * 10 + "\n")
             f.write(f"Total Tickets: {len(work_items)}\n")
-            f.write(f"High Priority: {high_count}\n")
-            f.write(f"Medium Priority: {medium_count}\n")
-            f.write(f"Low Priority: {low_count}\n")
+            f.write(f"High Priority: {priority_counts['HIGH']}\n")
+            f.write(f"Medium Priority: {priority_counts['MEDIUM']}\n")
+            f.write(f"Low Priority: {priority_counts['LOW']}\n")
         
         print(f"Enhanced text report generated: {output_file}")
     
-    def generate_output(self, work_items: List[Dict[str, Any]], output_type: str, days: int, use_claude: bool = False):
-        """Generate output in specified format"""
+    def generate_output(self, work_items: Iterable[Dict[str, Any]], output_type: str, days: int, use_claude: bool = False,
+                        top: Optional[int] = None):
+        """Generate output in specified format
+        
+        `work_items` may be any iterable; it is materialized once here because the Claude
+        attempt and the traditional fallback both walk it. `top` limits console output to
+        the N highest-priority items.
+        """
+        if not isinstance(work_items, list):
+            work_items = list(work_items)
         if not work_items:
             print("No work items found for the specified criteria.")
             return
@@ -1130,20 +1696,7 @@ Please format the response as structured analysis with clear sections for each w
                 claude_error_reason = error_msg
         
         # Analyze and sort work items (traditional method)
-        analyzed_items = []
-        for item in work_items:
-            score, priority = self.calculate_priority_score(item)
-            analysis = self.analyze_content(item)
-            
-            analyzed_items.append({
-                'work_item': item,
-                'priority_score': score,
-                'priority_level': priority,
-                'analysis': analysis
-            })
-        
-        # Sort by priority score (highest first)
-        analyzed_items.sort(key=lambda x: x['priority_score'], reverse=True)
+        analyzed_items = self._analyze_work_items(work_items, top if output_type == 'console' else None)
         
         if output_type in ['browser', 'html']:
             self._generate_html_output(analyzed_items, days, output_type == 'browser', claude_error_reason)
@@ -1154,107 +1707,134 @@ Please format the response as structured analysis with clear sections for each w
         elif output_type == 'email':
             self._send_email_output(analyzed_items, days, claude_error_reason)
     
-    def _generate_html_output(self, analyzed_items: List[Dict], days: int, open_browser: bool = False, claude_error_reason: str = None):
-        """Generate HTML output"""
-        html_content = self._build_html_report(analyzed_items, days, claude_error_reason)
+    def _analyze_work_items(self, work_items: List[Dict[str, Any]], limit: Optional[int] = None) -> List[OutputRow]:
+        """Score and analyze all work items in one batch, highest priority first
         
-        # Get appropriate output directory
-        if sys.platform == 'win32':
-            output_dir = Path.home() / 'Documents'
-        else:
-            output_dir = Path.home() / 'Downloads'
-            if not output_dir.exists():
-                output_dir = Path.home() / 'Documents'
-                if not output_dir.exists():
-                    output_dir = Path.home()
+        With a `limit`, only rows for the `limit` highest-scoring items are built.
+        """
+        # Bind the per-item scorer once for the whole batch
+        score_and_analyze = self._score_and_analyze
         
-        output_file = output_dir / 'TFS-Daily-Summary.html'
+        # Score into parallel columns
+        scores = []
+        levels = []
+        analyses = []
+        for item in work_items:
+            score, priority, analysis = score_and_analyze(item)
+            scores.append(score)
+            levels.append(priority)
+            analyses.append(analysis)
+        
+        # Sort an index by priority score (highest first), then build the rows once in that order
+        if limit is not None and limit < len(scores):
+            # Partial selection; same order as the full sort's first `limit` entries
+            order = heapq.nlargest(limit, range(len(scores)), key=scores.__getitem__)
+        else:
+            order = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
+        rows = []
+        for i in order:
+            work_item = work_items[i]
+            fields = work_item.get('fields', {})
+            rows.append(OutputRow(
+                id=work_item.get('id', 'Unknown'),
+                title=fields.get('System.Title', 'No Title'),
+                work_type=fields.get('System.WorkItemType', 'Unknown'),
+                state=fields.get('System.State', 'Unknown'),
+                score=scores[i],
+                level=levels[i],
+                action=analyses[i]['action_items'],
+                impact=analyses[i]['impact_assessment']
+            ))
+        return rows
+    
+    def _generate_html_output(self, analyzed_items: List[OutputRow], days: int, open_browser: bool = False, claude_error_reason: str = None):
+        """Generate HTML output"""
+        output_file = self.output_dir / 'TFS-Daily-Summary.html'
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Stream fragments straight to disk rather than building the whole report first,
+        # encoding each one directly instead of going through a text-mode wrapper
+        with open(output_file, 'wb') as f:
+            f.writelines(fragment.encode('utf-8')
+                         for fragment in self._iter_html_report(analyzed_items, days, claude_error_reason))
         
         print(f"[SAVED] HTML report saved to: {output_file}")
         
         if open_browser:
+            import webbrowser
             webbrowser.open(f'file://{output_file.absolute()}')
             print("[BROWSER] Report opened in browser")
     
-    def _generate_text_output(self, analyzed_items: List[Dict], days: int, claude_error_reason: str = None):
+    def _generate_text_output(self, analyzed_items: List[OutputRow], days: int, claude_error_reason: str = None):
         """Generate text output"""
-        lines = []
-        lines.append(f"TFS Ticket Analysis - Last {days} days")
-        lines.append("=" * 50)
-        lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"Total items: {len(analyzed_items)}")
-        
-        # Add Claude failure reason if present
-        if claude_error_reason:
-            lines.append("")
-            lines.append("Claude Analysis Failure Reason:")
-            lines.append(f"  - {claude_error_reason}")
+        output_file = self.output_dir / 'TFS-Daily-Summary.txt'
         
-        lines.append("")
+        with open(output_file, 'wb') as f:
+            f.writelines(fragment.encode('utf-8')
+                         for fragment in self._iter_text_report(analyzed_items, days, claude_error_reason))
         
-        for item_data in analyzed_items:
-            work_item = item_data['work_item']
-            fields = work_item.get('fields', {})
-            
-            lines.append(f"[{item_data['priority_level']}] {fields.get('System.Title', 'No Title')}")
-            lines.append(f"   Type: {fields.get('System.WorkItemType', 'Unknown')}")
-            lines.append(f"   State: {fields.get('System.State', 'Unknown')}")
-            lines.append(f"   ID: {work_item.get('id', 'Unknown')}")
-            lines.append(f"   Score: {item_data['priority_score']}")
-            lines.append(f"   Action: {item_data['analysis']['action_items']}")
-            lines.append("")
-        
-        content = '\n'.join(lines)
+        print(f"[SAVED] Text report saved to: {output_file}")
+    
+    def _iter_text_report(self, analyzed_items: List[OutputRow], days: int, claude_error_reason: str = None) -> Iterator[str]:
+        """Yield text report content in fragments (header, then one per work item)"""
+        yield f"TFS Ticket Analysis - Last {days} days\n"
+        yield "=" * 50 + "\n"
+        yield f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        yield f"Total items: {len(analyzed_items)}\n"
         
-        # Get appropriate output directory  
-        if sys.platform == 'win32':
-            output_dir = Path.home() / 'Documents'
+        # Add Claude failure reason if present
+        if claude_error_reason:
+            yield "\nClaude Analysis Failure Reason:\n"
+            yield f"  - {claude_error_reason}\n"
+        
+        # Each item is preceded by a blank separator line
+        for row in analyzed_items:
+            yield (f"\n[{row.level}] {row.title}\n"
+                   f"   Type: {row.work_type}\n"
+                   f"   State: {row.state}\n"
+                   f"   ID: {row.id}\n"
+                   f"   Score: {row.score}\n"
+                   f"   Action: {row.action}\n")
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _enable_console_colors():
+        """Let Windows consoles render the ANSI priority colours, using colorama when installed"""
+        if sys.platform != 'win32':
+            return
+        try:
+            import colorama
+        except ImportError:
+            return
+        # just_fix_windows_console() is colorama 0.4.6+; older releases only offer init()
+        if hasattr(colorama, 'just_fix_windows_console'):
+            colorama.just_fix_windows_console()
         else:
-            output_dir = Path.home() / 'Downloads'
-            if not output_dir.exists():
-                output_dir = Path.home() / 'Documents'
-                if not output_dir.exists():
-                    output_dir = Path.home()
-        
-        output_file = output_dir / 'TFS-Daily-Summary.txt'
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        print(f"[SAVED] Text report saved to: {output_file}")
+            colorama.init()
     
-    def _generate_console_output(self, analyzed_items: List[Dict], days: int, claude_error_reason: str = None):
+    def _generate_console_output(self, analyzed_items: List[OutputRow], days: int, claude_error_reason: str = None):
         """Generate console output with colors"""
+        self._enable_console_colors()
         print(f"\nTFS Ticket Analysis TFS Ticket Analysis - Last {days} days")
         print("=" * 60)
         print(f"Schedule Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"Default Output Method Total items: {len(analyzed_items)}")
         print()
         
-        priority_colors = {
-            'HIGH': '\033[91m',     # Red
-            'MEDIUM': '\033[93m',   # Yellow  
-            'LOW': '\033[92m'       # Green
-        }
-        reset_color = '\033[0m'
+        priority_tags = self._CONSOLE_PRIORITY_TAGS
+        reset_color = self._CONSOLE_RESET
         
-        for item_data in analyzed_items:
-            work_item = item_data['work_item']
-            fields = work_item.get('fields', {})
-            priority = item_data['priority_level']
+        # Build every block first and write them out in one call instead of six prints per item
+        parts = []
+        for row in analyzed_items:
+            tag = priority_tags.get(row.level) or f"[{row.level}]{reset_color}"
             
-            color = priority_colors.get(priority, '')
-            
-            print(f"{color}[{priority}]{reset_color} {fields.get('System.Title', 'No Title')}")
-            print(f"   Type: {fields.get('System.WorkItemType', 'Unknown')}")
-            print(f"   State: {fields.get('System.State', 'Unknown')}")
-            print(f"   ID: {work_item.get('id', 'Unknown')}")
-            print(f"   Score: {item_data['priority_score']}")
-            print(f"   Action: {item_data['analysis']['action_items']}")
-            print()
+            parts.append(f"{tag} {row.title}\n"
+                         f"   Type: {row.work_type}\n"
+                         f"   State: {row.state}\n"
+                         f"   ID: {row.id}\n"
+                         f"   Score: {row.score}\n"
+                         f"   Action: {row.action}\n\n")
+        sys.stdout.write(''.join(parts))
         
         # Display Claude failure reason if present
         if claude_error_reason:
@@ -1262,31 +1842,60 @@ Please format the response as structured analysis with clear sections for each w
             print(f"  - {claude_error_reason}")
             print()
     
-    def _build_html_report(self, analyzed_items: List[Dict], days: int, claude_error_reason: str = None) -> str:
+    # Report stylesheet, emitted verbatim between the per-report <head> and <body> parts
+    _HTML_REPORT_STYLE = """    <style>
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif; margin: 20px; }
+        .header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px; border-radius: 8px; }
+        .summary { background: #f8f9fa; padding: 15px; border-radius: 6px; margin: 20px 0; }
+        .work-item { margin: 15px 0; padding: 15px; border-left: 4px solid #ddd; background: white; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        .high { border-left-color: #dc3545; }
+        .medium { border-left-color: #ffc107; }
+        .low { border-left-color: #28a745; }
+        .priority { font-weight: bold; padding: 4px 8px; border-radius: 4px; color: white; display: inline-block; }
+        .priority.high { background: #dc3545; }
+        .priority.medium { background: #ffc107; color: #212529; }
+        .priority.low { background: #28a745; }
+        .title { font-size: 18px; font-weight: bold; margin: 10px 0; }
+        .details { color: #666; font-size: 14px; }
+        .analysis { background: #f8f9fa; padding: 10px; border-radius: 4px; margin: 10px 0; }
+    </style>
+"""
+    
+    # One work item in the HTML report, filled with str.format_map
+    _HTML_ROW_TEMPLATE = """
+    <div class="work-item {priority}">
+        <span class="priority {priority}">{level}</span>
+        <div class="title">{title}</div>
+        <div class="details">
+            <strong>Type:</strong> {work_type} | 
+            <strong>State:</strong> {state} | 
+            <strong>ID:</strong> {id} | 
+            <strong>Score:</strong> {score}
+        </div>
+        <div class="analysis">
+            <strong>Action:</strong> {action}<br>
+            <strong>Impact:</strong> {impact}
+        </div>
+    </div>
+"""
+    
+    def _build_html_report(self, analyzed_items: List[OutputRow], days: int, claude_error_reason: str = None) -> str:
         """Build HTML report content"""
-        html_template = f"""
+        return ''.join(self._iter_html_report(analyzed_items, days, claude_error_reason))
+    
+    def _iter_html_report(self, analyzed_items: List[OutputRow], days: int, claude_error_reason: str = None) -> Iterator[str]:
+        """Yield HTML report content in fragments (header, one per work item, footer)"""
+        priority_counts = Counter(row.level for row in analyzed_items)
+        
+        yield f"""
 <!DOCTYPE html>
 <html>
 <head>
     <title>TFS Ticket Analysis - Last {days} days</title>
     <meta charset="utf-8">
-    <style>
-        body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif; margin: 20px; }}
-        .header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px; border-radius: 8px; }}
-        .summary {{ background: #f8f9fa; padding: 15px; border-radius: 6px; margin: 20px 0; }}
-        .work-item {{ margin: 15px 0; padding: 15px; border-left: 4px solid #ddd; background: white; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-        .high {{ border-left-color: #dc3545; }}
-        .medium {{ border-left-color: #ffc107; }}
-        .low {{ border-left-color: #28a745; }}
-        .priority {{ font-weight: bold; padding: 4px 8px; border-radius: 4px; color: white; display: inline-block; }}
-        .priority.high {{ background: #dc3545; }}
-        .priority.medium {{ background: #ffc107; color: #212529; }}
-        .priority.low {{ background: #28a745; }}
-        .title {{ font-size: 18px; font-weight: bold; margin: 10px 0; }}
-        .details {{ color: #666; font-size: 14px; }}
-        .analysis {{ background: #f8f9fa; padding: 10px; border-radius: 4px; margin: 10px 0; }}
-    </style>
-</head>
+"""
+        yield self._HTML_REPORT_STYLE
+        yield f"""</head>
 <body>
     <div class="header">
         <h1>TFS Ticket Analysis TFS Ticket Analysis</h1>
@@ -1296,74 +1905,159 @@ Please format the response as structured analysis with clear sections for each w
     <div class="summary">
         <h2>Default Output Method Summary</h2>
         <p><strong>Total Items:</strong> {len(analyzed_items)}</p>
-        <p><strong>High Priority:</strong> {len([i for i in analyzed_items if i['priority_level'] == 'HIGH'])}</p>
-        <p><strong>Medium Priority:</strong> {len([i for i in analyzed_items if i['priority_level'] == 'MEDIUM'])}</p>
-        <p><strong>Low Priority:</strong> {len([i for i in analyzed_items if i['priority_level'] == 'LOW'])}</p>"""
+        <p><strong>High Priority:</strong> {priority_counts['HIGH']}</p>
+        <p><strong>Medium Priority:</strong> {priority_counts['MEDIUM']}</p>
+        <p><strong>Low Priority:</strong> {priority_counts['LOW']}</p>"""
         
         if claude_error_reason:
-            html_template += f"""
+            yield f"""
         <div style='background: #fff3cd; border: 1px solid #ffeaa7; border-radius: 4px; padding: 10px; margin: 10px 0;'>
-            <strong>[WARNING] Claude Analysis Failure:</strong> {claude_error_reason}
+            <strong>[WARNING] Claude Analysis Failure:</strong> {html.escape(claude_error_reason)}
         </div>"""
         
-        html_template += """
+        yield """
     </div>
 """
         
-        for item_data in analyzed_items:
-            work_item = item_data['work_item']
-            fields = work_item.get('fields', {})
-            priority = item_data['priority_level'].lower()
-            
-            html_template += f"""
-    <div class="work-item {priority}">
-        <span class="priority {priority}">{item_data['priority_level']}</span>
-        <div class="title">{fields.get('System.Title', 'No Title')}</div>
-        <div class="details">
-            <strong>Type:</strong> {fields.get('System.WorkItemType', 'Unknown')} | 
-            <strong>State:</strong> {fields.get('System.State', 'Unknown')} | 
-            <strong>ID:</strong> {work_item.get('id', 'Unknown')} | 
-            <strong>Score:</strong> {item_data['priority_score']}
-        </div>
-        <div class="analysis">
-            <strong>Action:</strong> {item_data['analysis']['action_items']}<br>
-            <strong>Impact:</strong> {item_data['analysis']['impact_assessment']}
-        </div>
-    </div>
-"""
+        row_template = self._HTML_ROW_TEMPLATE
+        css_classes = self._PRIORITY_CSS_CLASSES
+        escape = html.escape
+        for row in analyzed_items:
+            # Titles and analysis text are user-entered; escape every field once for this row
+            values = {name: escape(str(value)) for name, value in zip(row._fields, row)}
+            values['priority'] = css_classes.get(row.level) or row.level.lower()
+            yield row_template.format_map(values)
         
-        html_template += """
+        yield """
 </body>
 </html>
 """
-        return html_template
     
-    def _send_email_output(self, analyzed_items: List[Dict], days: int, claude_error_reason: str = None):
-        """Send email with HTML report"""
+    def _send_enhanced_email_output(self, work_items: List[Dict[str, Any]], claude_response: str, days: int) -> bool:
+        """Email the Claude-enhanced report, with the same rows as the other enhanced outputs"""
+        def render() -> str:
+            enhanced_rows = self._enhance_work_items(work_items, claude_response)
+            priority_counts = Counter(row.level for row in enhanced_rows)
+            return ''.join(self._iter_enhanced_html_report(enhanced_rows, claude_response,
+                                                           priority_counts, datetime.now()))
+        
+        return self._send_report_email(days, render)
+    
+    def _send_email_output(self, analyzed_items: List[OutputRow], days: int, claude_error_reason: str = None) -> bool:
+        """Send email with HTML report; True if it was sent
+        
+        Reports go through the connection kept by _get_smtp(), so several sends in one
+        run log in once.
+        """
+        return self._send_report_email(
+            days, lambda: self._build_html_report(analyzed_items, days, claude_error_reason))
+    
+    def _send_report_email(self, days: int, render: Callable[[], str]) -> bool:
+        """Send the HTML produced by render() as the report email; True if it was sent"""
         if not all(k in self.config for k in ['email_address', 'email_password', 'smtp_server', 'smtp_port']):
             print("[ERROR] Email configuration missing. Run setup first.")
-            return
+            return False
         
-        html_content = self._build_html_report(analyzed_items, days, claude_error_reason)
+        try:
+            # Connect (or check the kept connection) in the background while the report is rendered
+            from concurrent.futures import ThreadPoolExecutor
+            
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                smtp_future = executor.submit(self._get_smtp)
+                msg = self._build_email_message(days, render())
+                smtp = smtp_future.result()
+            try:
+                smtp.send_message(msg)
+            except Exception:
+                self._close_smtp()
+                raise
+            self._smtp_sent += 1
+            
+            print(f"Email Configuration Email sent successfully to {self.config['email_address']}")
+            return True
+            
+        except Exception as e:
+            print(f"[ERROR] Failed to send email: {e}")
+            return False
+    
+    def _build_email_message(self, days: int, html_content: str) -> 'EmailMessage':
+        """Build the report email addressed to the configured account"""
+        from email.message import EmailMessage
         
-        msg = MimeMultipart('alternative')
+        msg = EmailMessage()
         msg['Subject'] = f"TFS Ticket Analysis - Last {days} days"
         msg['From'] = self.config['email_address']
         msg['To'] = self.config['email_address']
         
-        html_part = MimeText(html_content, 'html')
-        msg.attach(html_part)
+        # The report is the only part, so it is the message body itself rather than
+        # a single-entry multipart/alternative wrapper
+        msg.set_content(html_content, subtype='html', charset='utf-8')
+        return msg
+    
+    def send_reports_batch(self, jobs: List[tuple]) -> int:
+        """Email one report per (days, analyzed_items) job, returning how many were sent
+        
+        All reports share the connection kept by _get_smtp(). The batch stops early
+        once a third of its reports have failed to send.
+        """
+        sent = failed = 0
+        for days, analyzed_items in jobs:
+            if self._send_email_output(analyzed_items, days):
+                sent += 1
+            else:
+                failed += 1
+                if failed * 3 >= len(jobs):
+                    print(f"[ERROR] Stopping after {failed} of {len(jobs)} report emails failed")
+                    break
+        return sent
+    
+    def _get_smtp(self) -> 'smtplib.SMTP':
+        """Authenticated SMTP connection kept for the rest of the run
         
+        The connection is reused while the server still answers NOOP, and replaced
+        after SMTP_MESSAGES_PER_CONNECTION messages; it is closed at exit.
+        """
+        import smtplib
+        if self._smtp is not None:
+            if self._smtp_sent < self.SMTP_MESSAGES_PER_CONNECTION:
+                try:
+                    if self._smtp.noop()[0] == 250:
+                        return self._smtp
+                except (smtplib.SMTPException, OSError):
+                    pass
+            self._close_smtp()
+        
+        self._smtp = self._open_smtp()
+        self._smtp_sent = 0
+        atexit.register(self._close_smtp)
+        return self._smtp
+    
+    def _close_smtp(self):
+        """Log out of the kept SMTP connection, if there is one"""
+        import smtplib
+        smtp, self._smtp = self._smtp, None
+        if smtp is None:
+            return
+        atexit.unregister(self._close_smtp)
         try:
-            with smtplib.SMTP(self.config['smtp_server'], int(self.config['smtp_port'])) as server:
-                server.starttls()
-                server.login(self.config['email_address'], self.config['email_password'])
-                server.send_message(msg)
-            
-            print(f"Email Configuration Email sent successfully to {self.config['email_address']}")
-            
-        except Exception as e:
-            print(f"[ERROR] Failed to send email: {e}")
+            smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            smtp.close()
+    
+    def _open_smtp(self) -> 'smtplib.SMTP':
+        """Open an authenticated SMTP connection for the configured account"""
+        import smtplib
+        server = smtplib.SMTP(self.config['smtp_server'], int(self.config['smtp_port']))
+        try:
+            server.starttls()
+            server.login(self.config['email_address'], self.config['email_password'])
+        except Exception:
+            server.close()
+            raise
+        return server
+
+# 24-hour HH:MM for --cron-time, the pattern easy-setup.py validates with
+_TIME_RE = re.compile(r'^([01]?\d|2[0-3]):([0-5]\d)$')
 
 def setup_cron_job(output_method: str = 'console', time_str: str = '08:00'):
     """Setup cron job for daily analysis (Linux/Mac)"""
@@ -1380,14 +2074,24 @@ def setup_cron_job(output_method: str = 'console', time_str: str = '08:00'):
         'console': ''
     }.get(output_method, '--browser')
 
+    # Parse HH:MM once; cron fields are minute then hour
+    time_match = _TIME_RE.fullmatch(time_str)
+    if not time_match:
+        print(f"[ERROR] Invalid cron time '{time_str}'. Use HH:MM, e.g. 08:00")
+        return
+    hour, minute = int(time_match.group(1)), int(time_match.group(2))
+    schedule = '@daily' if (hour, minute) == (0, 0) else f'{minute} {hour} * * *'
+    
     script_path = Path(__file__).absolute()
-    cron_command = f'{time_str.split(":")[1]} {time_str.split(":")[0]} * * * /usr/bin/python3 "{script_path}" 1 {output_flag}'.strip()
+    cron_command = f'{schedule} /usr/bin/python3 "{script_path}" 1 {output_flag}'.strip()
 
     print(f"Add this line to your crontab (crontab -e):")
     print(f"{cron_command}")
-    print(f"\nThis will run daily at {time_str}")
+    print(f"\nThis will run daily at {hour:02d}:{minute:02d}")
 
-def main():
+@lru_cache(maxsize=1)
+def _build_arg_parser() -> argparse.ArgumentParser:
+    """Command-line parser, built once per process"""
     parser = argparse.ArgumentParser(description='Cross-platform TFS Ticket Analyzer with Claude AI support')
     parser.add_argument('timevalue', nargs='?', default=1, type=int, help='Number of days or hours to analyze')
 
@@ -1411,13 +2115,19 @@ def main():
     parser.add_argument('--claude', action='store_true', help='Use Claude AI for enhanced analysis')
     parser.add_argument('--no-ai', action='store_true', help='Disable Claude AI (traditional analysis only)')
     parser.add_argument('-d', '--details', action='store_true', help='Show detailed processing information')
+    parser.add_argument('--top', type=int, metavar='N', help='Show only the N highest-priority items (console output)')
+    parser.add_argument('--batch-days', metavar='D1,D2,...',
+                        help='Email one report per time range (e.g. 1,7,30) over a single SMTP session')
 
     # Additional options
     parser.add_argument('--windows-auth', action='store_true', help='Use Windows authentication')
     parser.add_argument('--setup-cron', action='store_true', help='Setup daily cron job (Linux/Mac)')
     parser.add_argument('--cron-time', default='08:00', help='Cron job time (HH:MM format)')
     parser.add_argument('--version', action='version', version='TFS Analyzer 2.2.0')
-    
+    return parser
+
+def main():
+    parser = _build_arg_parser()
     args = parser.parse_args()
     
     if len(sys.argv) == 1:
@@ -1434,7 +2144,7 @@ def main():
         analyzer.setup_claude_config()
         return
     
-    if hasattr(args, 'test_claude') and args.test_claude:
+    if args.test_claude:
         analyzer.test_claude_configuration()
         return
     
@@ -1460,6 +2170,30 @@ def main():
         print("  python tfs-analyzer.py 7 --html      # Analyze 7 days")
         print("  python tfs-analyzer.py 12 --hours --browser  # Analyze 12 hours")
         return
+    
+    if args.top is not None and args.top < 1:
+        print("[ERROR] --top must be at least 1")
+        return
+    
+    if args.batch_days:
+        try:
+            batch_days = [int(value) for value in args.batch_days.split(',')]
+        except ValueError:
+            batch_days = []
+        if not batch_days or min(batch_days) < 1:
+            print("[ERROR] --batch-days takes comma-separated values of at least 1, e.g. 1,7,30")
+            return
+        
+        # Traditional analysis per range; unchanged items come from the work item cache after the first fetch
+        jobs = []
+        for timevalue in batch_days:
+            work_items = analyzer.get_work_items(timevalue, args.hours)
+            if work_items:
+                jobs.append((timevalue, analyzer._analyze_work_items(work_items)))
+            else:
+                print(f"No work items found for the last {timevalue} {'hours' if args.hours else 'days'}.")
+        analyzer.send_reports_batch(jobs)
+        return
 
     # Determine output method
     output_method = None
@@ -1476,6 +2210,7 @@ def main():
     
     # Determine Claude AI usage
     use_claude = args.claude
+    work_items_future = None
     if args.claude:
         # Verify Claude setup when explicitly requested
         print("Verifying Claude AI configuration...")
@@ -1497,28 +2232,23 @@ def main():
         # Check if Claude AI is configured by default
         default_claude = analyzer.config.get('use_claude_ai', 'false').lower() == 'true'
         if default_claude:
-            # Quick verification for default usage (less verbose)
-            try:
-                subprocess.run(['claude-code', '--version'], 
-                             capture_output=True, check=True)
-                # Test authentication
-                auth_ok = False
-                try:
-                    subprocess.run(['az', 'account', 'show'], 
-                                 capture_output=True, check=True)
-                    auth_ok = True
-                except (subprocess.CalledProcessError, FileNotFoundError):
-                    if analyzer.config.get('pat'):
-                        auth_ok = True
-                
-                if auth_ok:
-                    use_claude = True
-                else:
-                    use_claude = False
-                    print("[WARNING]  Claude AI configured by default but verification failed - using traditional analysis")
-            except (subprocess.CalledProcessError, FileNotFoundError):
+            # Fetch work items in the background so the TFS round trips overlap the tool probes
+            from concurrent.futures import ThreadPoolExecutor
+            
+            fetch_executor = ThreadPoolExecutor(max_workers=1)
+            work_items_future = fetch_executor.submit(analyzer.get_work_items, args.timevalue, args.hours)
+            fetch_executor.shutdown(wait=False)
+            
+            # Quick verification for default usage (less verbose); cached for invoke_claude_analysis()
+            probes = analyzer._probe_tools(['claude_code', 'az_account'])
+            if not probes['claude_code']:
                 use_claude = False
                 print("[WARNING]  Claude AI configured by default but Claude Code not found - using traditional analysis")
+            elif probes['az_account'] or analyzer.config.get('pat'):
+                use_claude = True
+            else:
+                use_claude = False
+                print("[WARNING]  Claude AI configured by default but verification failed - using traditional analysis")
         else:
             use_claude = False
     
@@ -1531,8 +2261,11 @@ def main():
         print(f"Claude AI: {'enabled' if use_claude else 'disabled'}")
 
     # Get and analyze work items
-    work_items = analyzer.get_work_items(args.timevalue, args.hours)
-    analyzer.generate_output(work_items, output_method, args.timevalue, use_claude)
+    if work_items_future is not None:
+        work_items = work_items_future.result()
+    else:
+        work_items = analyzer.get_work_items(args.timevalue, args.hours)
+    analyzer.generate_output(work_items, output_method, args.timevalue, use_claude, args.top)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file